@@ -1,21 +1,58 @@
+import argparse
+import atexit
+import copy
+import functools
+import hashlib
+import inspect
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import types
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, concurrent GlyphStore saves are not serialized there
+    fcntl = None
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, peak memory is not reported there
+    resource = None
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
 from manim import *
+from manim.renderer import cairo_renderer
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.bezier import partial_bezier_points
+from manim.utils.exceptions import EndSceneEarlyException
+from manim.mobject.svg.tex_mobject import SCALE_FACTOR_PER_FONT_POINT
+from manim.utils.file_ops import is_webm_format, write_to_movie
+from manim.utils.tex_file_writing import tex_hash
+try:
+    from manim.constants import FFMPEG_BIN
+except ImportError:
+    FFMPEG_BIN = "ffmpeg"
+
+#   written for manim CE v0.11.0 (pip install manim==0.11.0), the renderer, file writer and tex
+#   hooks below patch internals of that version and are not expected to work with later ones
 
 #   for scenes 'Circles0to6Rad', 'RadianExplanation101' and 'EndAnimation' in manim CE v0.11.0
 #   navigate to /manim/mobject/geometry.py
 #   comment out line 142 "self.reset_endpoints_based_on_top(tip, at_start)"
 
-#   for scenes that render slowly due to updaters, modify the following code
-#   manim>Mobject>types>vectorized_mobject.py>VMobject>align_points
-#   for n in range(n_subpaths):
-#             sp1 = get_nth_subpath(subpaths1, n)
-#             sp2 = get_nth_subpath(subpaths2, n)
-#             diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
-#             diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
-#             if max(len(sp1), len(sp2)) < 350:
-#                 sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-#                 sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-#             new_path1 = np.append(new_path1, sp1, axis=0)
-#             new_path2 = np.append(new_path2, sp2, axis=0)
+#   for scenes that render slowly due to updaters, VMobject.align_points is replaced by AlignPoints
+#   once a scene of this module renders (see install_patches). Set align_threshold on a Scene or a mobject to skip aligning subpaths of that many
+#   points or more, instead of editing manim>Mobject>types>vectorized_mobject.py by hand.
 
 config.tex_template = TexTemplate()
 
@@ -42,16 +79,1647 @@ ANIM_PURPLE = "#CC0099"
 TEXT_COLOR = "#463622"
 
 def get_background():
-    """Returns a gradient rectangle to be used as the background."""
-    background = Rectangle(
-            width=config["frame_width"],
-            height=config["frame_width"],
-            stroke_width=0,
-            fill_color=color.color_gradient(["#D5D4C9","#DBD7CF"], 32), #astroparche_light
-            #fill_color=color.color_gradient(["#ECECEC", "#F2F2F2"], 32), #whiteboard_modern
-            fill_opacity=1, z_index=-1000)
+    """Returns a gradient rectangle to be used as the background, drawn from a cached raster (see BackgroundRaster)."""
+    background = BackgroundRaster(
+            color.color_gradient(["#D5D4C9","#DBD7CF"], 32)) #astroparche_light
+            #color.color_gradient(["#ECECEC", "#F2F2F2"], 32)) #whiteboard_modern
     return background
 
+class BackgroundRaster(Mobject):
+    """A frame-sized gradient background drawn by copying a cached raster instead of filling a Rectangle.
+
+    The raster is rendered once per resolution and palette, saved as a .npy file in the media
+    directory (or in directory, when set) and memory-mapped. A camera showing the whole default frame starts the frame from
+    it, any other camera (e.g. a zoomed camera) fills the Rectangle as before. The background
+    must be added to the scene directly, not inside a group, and is only drawn once
+    BackgroundRaster.install() is called (see install_patches).
+    """
+    directory = None
+    version = 1
+    rasters = {}
+    original_capture_mobjects = None
+
+    def __init__(self, colors, **kwargs):
+        """
+        Parameters
+        -----------
+        colors : list
+            The colors of the gradient, from left to right.
+        """
+        super().__init__(z_index=-1000, **kwargs)
+        # Kept as a string so the play hash, which skips lists, covers the palette
+        self.palette = " ".join(str(c) for c in colors)
+        self.rectangle = None
+
+    @property
+    def colors(self):
+        return self.palette.split()
+
+    @classmethod
+    def install(self):
+        """Makes Camera.capture_mobjects draw BackgroundRaster mobjects."""
+        if self.original_capture_mobjects is not None:
+            return
+
+        self.original_capture_mobjects = Camera.capture_mobjects
+
+        def capture_mobjects(camera, mobjects, **kwargs):
+            mobjects = [m.draw(camera) if isinstance(m, BackgroundRaster) else m for m in mobjects]
+            return BackgroundRaster.original_capture_mobjects(camera, mobjects, **kwargs)
+
+        Camera.capture_mobjects = capture_mobjects
+
+    def get_rectangle(self):
+        """Returns the Rectangle the raster is rendered from."""
+        if self.rectangle is None:
+            self.rectangle = Rectangle(
+                width=config["frame_width"],
+                height=config["frame_width"],
+                stroke_width=0,
+                fill_color=self.colors,
+                fill_opacity=1, z_index=-1000)
+
+        return self.rectangle
+
+    def get_raster(self):
+        """Returns the pixel array of the background at the current resolution, rendering it on a miss."""
+        key = hashlib.blake2b(repr([
+            self.version, config["pixel_width"], config["pixel_height"], config["frame_width"], config["frame_height"], self.palette
+            ]).encode(), digest_size=16).hexdigest()
+        directory = self.directory or os.path.join(config.media_dir, "background_cache")
+
+        if (directory, key) not in self.rasters:
+            path = os.path.join(directory, key + ".npy")
+            if not os.path.isfile(path):
+                camera = Camera()
+                camera.capture_mobject(self.get_rectangle())
+
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    np.save(f, camera.pixel_array)
+                os.replace(tmp_path, path)
+
+            self.rasters[(directory, key)] = np.load(path, mmap_mode="r")
+
+        return self.rasters[(directory, key)]
+
+    def draw(self, camera):
+        """Starts the frame of the camera from the raster and returns what is left for the camera to draw."""
+        shows_full_frame = (
+            camera.pixel_array.shape[:2] == (config["pixel_height"], config["pixel_width"])
+            and np.allclose(camera.frame_center, ORIGIN)
+            and np.isclose(camera.frame_width, config["frame_width"])
+            and np.isclose(camera.frame_height, config["frame_height"]))
+        if not shows_full_frame:
+            return self.get_rectangle()
+
+        camera.pixel_array[:, :, :] = self.get_raster()
+
+        # A Mobject without points draws nothing
+        return self
+
+class AlignPoints():
+    """A faster VMobject.align_points, used in place of manim's once AlignPoints.install() is called.
+
+    Curve insertion is vectorized: how the curves of a subpath are split to reach a number of
+    curves is computed once per (number of curves, target number of curves) pair, cached, and
+    applied to every curve in a single einsum. Subpaths with at least `threshold` points are left
+    unaligned, as the old hand-edit of manim did, which is enough for become(). A Scene or a
+    mobject can set its own threshold with an align_threshold attribute.
+    """
+    threshold = None
+    plans = {}
+    original_align_points = None
+
+    @classmethod
+    def install(self):
+        """Replaces VMobject.align_points and makes Scene.render apply the scene's align_threshold."""
+        if self.original_align_points is not None:
+            return
+
+        self.original_align_points = VMobject.align_points
+        VMobject.align_points = lambda vmobject, other: AlignPoints.align_points(vmobject, other)
+
+        original_render = Scene.render
+
+        def render(scene, *args, **kwargs):
+            previous = AlignPoints.threshold
+            AlignPoints.threshold = getattr(scene, "align_threshold", previous)
+            try:
+                return original_render(scene, *args, **kwargs)
+            finally:
+                AlignPoints.threshold = previous
+
+        Scene.render = render
+
+    @classmethod
+    def get_threshold(self, *mobjects):
+        thresholds = [m.align_threshold for m in mobjects if getattr(m, "align_threshold", None) is not None]
+        return min(thresholds) if thresholds else self.threshold
+
+    @classmethod
+    def get_plan(self, curr_num, target_num, nppcc):
+        """Returns the source curve and the partial bezier matrix of every curve after the insertion."""
+        key = (curr_num, target_num, nppcc)
+        if key not in self.plans:
+            # Same split as VMobject.insert_n_curves_to_point_list
+            repeat_indices = (np.arange(target_num) * curr_num) // target_num
+            split_factors = np.bincount(repeat_indices, minlength=curr_num)
+
+            sources, matrices = [], []
+            for i, sf in enumerate(split_factors):
+                alphas = np.linspace(0, 1, sf + 1)
+                for a1, a2 in zip(alphas, alphas[1:]):
+                    sources.append(i)
+                    # partial_bezier_points is linear in the points, so applying it to the identity gives its matrix
+                    matrices.append(partial_bezier_points(np.identity(nppcc), a1, a2))
+
+            self.plans[key] = (np.array(sources), np.array(matrices))
+
+        return self.plans[key]
+
+    @classmethod
+    def insert_n_curves(self, points, n, nppcc):
+        """Vectorized VMobject.insert_n_curves_to_point_list."""
+        points = np.asarray(points)
+        if n == 0:
+            return points
+        if len(points) == 1:
+            return np.repeat(points, nppcc * n, 0)
+
+        curr_num = len(points) // nppcc
+        sources, matrices = self.get_plan(curr_num, curr_num + n, nppcc)
+        quads = points[:curr_num * nppcc].reshape(curr_num, nppcc, -1)
+
+        return np.einsum("kij,kjd->kid", matrices, quads[sources]).reshape(-1, points.shape[1])
+
+    @classmethod
+    def align_points(self, vmobject1, vmobject2):
+        """Aligns the points of two VMobjects, like VMobject.align_points."""
+        vmobject1.align_rgbas(vmobject2)
+        if vmobject1.get_num_points() == vmobject2.get_num_points():
+            return vmobject1
+
+        for mob in vmobject1, vmobject2:
+            # If there are no points, add one to where the "center" is
+            if mob.has_no_points():
+                mob.start_new_path(mob.get_center())
+            # If there's only one point, turn it into a null curve
+            if mob.has_new_path_started():
+                mob.add_line_to(mob.get_last_point())
+
+        subpaths1 = vmobject1.get_subpaths()
+        subpaths2 = vmobject2.get_subpaths()
+        nppcc = vmobject1.n_points_per_cubic_curve
+        threshold = self.get_threshold(vmobject1, vmobject2)
+
+        def get_nth_subpath(path_list, n):
+            if n >= len(path_list):
+                # Create a null path at the very end
+                return np.array([path_list[-1][-1]] * nppcc)
+            return np.asarray(path_list[n])
+
+        new_path1, new_path2 = [], []
+        for n in range(max(len(subpaths1), len(subpaths2))):
+            sp1 = get_nth_subpath(subpaths1, n)
+            sp2 = get_nth_subpath(subpaths2, n)
+            if threshold is None or max(len(sp1), len(sp2)) < threshold:
+                diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
+                diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
+                sp1 = self.insert_n_curves(sp1, diff1, nppcc)
+                sp2 = self.insert_n_curves(sp2, diff2, nppcc)
+            new_path1.append(sp1)
+            new_path2.append(sp2)
+
+        vmobject1.set_points(np.concatenate(new_path1))
+        vmobject2.set_points(np.concatenate(new_path2))
+
+        return vmobject1
+
+def get_scene_classes():
+    """Returns every Scene subclass defined in this module, in the order they are defined.
+
+    Classes that set renderable = False in their own body (bases and scenes rendered by their
+    own entry point) are left out, their subclasses are not.
+    """
+    return [
+        obj for obj in globals().values()
+        if isinstance(obj, type) and issubclass(obj, Scene) and obj.__module__ == __name__
+        and vars(obj).get("renderable", True)
+        ]
+
+def get_stable_identity(obj):
+    """Returns a string describing obj by its content, the same in every run, to be hashed.
+
+    Functions are described by their code and default values rather than by their address.
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return repr(obj)
+    if isinstance(obj, np.ndarray):
+        return "array(" + repr(obj.tolist()) + ")"
+    if isinstance(obj, (list, tuple)):
+        return "[" + ", ".join(get_stable_identity(i) for i in obj) + "]"
+    if isinstance(obj, (set, frozenset)):
+        # Iteration order of sets of strings changes between runs
+        return "{" + ", ".join(sorted(get_stable_identity(i) for i in obj)) + "}"
+    if isinstance(obj, dict):
+        return "{" + ", ".join(f"{get_stable_identity(k)}: {get_stable_identity(v)}" for k, v in obj.items()) + "}"
+    if isinstance(obj, type):
+        return obj.__qualname__
+    if isinstance(obj, types.MethodType):
+        return get_stable_identity(obj.__func__)
+    if isinstance(obj, types.FunctionType):
+        return f"{obj.__qualname__}({get_stable_identity(obj.__code__)}, {get_stable_identity(obj.__defaults__)})"
+    if isinstance(obj, types.CodeType):
+        return f"code({obj.co_code.hex()}, {get_stable_identity(obj.co_consts)}, {get_stable_identity(obj.co_names)})"
+
+    return type(obj).__qualname__
+
+@functools.lru_cache(maxsize=None)
+def get_source_hash(module_name):
+    """Returns a hash of the source file of a module, which covers every helper and constant it defines."""
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    if path is None:
+        return ""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+class Draft():
+    """Settings of the draft preview rendered by render_draft.
+
+    A draft is rendered at a fraction of the resolution and keeps one frame out of every few of
+    the final render (see DraftRenderer), so its frame rate divides the final one and every play
+    and wait lasts as many final frames as in the final render. While it is enabled, the glyphs
+    of TexCache, GlyphStore and LabelCache labels are drawn as their bounding boxes, which keeps
+    the layout readable and costs a few curves instead of many. Tex, MathTex and Text built
+    directly by a scene are not covered and are drawn as usual.
+    """
+    enabled = False
+    resolution = 0.25
+    frame_rate = 15
+
+    @classmethod
+    def stand_in(self, mobject):
+        """Replaces every glyph of the mobject by its bounding box when drafting and returns the mobject."""
+        if not self.enabled:
+            return mobject
+
+        for member in mobject.family_members_with_points():
+            (x0, y0, z), (x1, y1, _) = member.points.min(axis=0), member.points.max(axis=0)
+            member.set_points_as_corners([(x0, y0, z), (x1, y0, z), (x1, y1, z), (x0, y1, z), (x0, y0, z)])
+
+        return mobject
+
+class PlayHash():
+    """Partial movie hashes that account for updaters, used in place of manim's once PlayHash.install() is called.
+
+    manim hashes a play from its mobjects and animations but cannot tell what their updaters
+    will do, which is why scenes driven by updaters had to disable caching. This hash covers the
+    state of every mobject in the scene and of the camera frames, the attributes, rate function
+    and target of every animation, and a stable identity of every updater: its code, constants
+    and the current value of every ValueTracker, mobject, function and global it reads. The
+    source of the scene's module and the scalar attributes of the scene are hashed as well.
+
+    manim skips a cached play in a single step of its whole run time, which leaves updaters
+    integrating dt (e.g. ProgressiveReveal) in another state than a clean render. Cached plays
+    are therefore stepped through frame by frame, running every updater without rasterizing
+    or writing anything.
+    """
+    version = 2
+    original_get_hash = None
+
+    @classmethod
+    def install(self):
+        """Replaces the hash manim's CairoRenderer gives to each play and replays cached plays frame by frame."""
+        if self.original_get_hash is not None:
+            return
+
+        self.original_get_hash = cairo_renderer.get_hash_from_play_call
+        cairo_renderer.get_hash_from_play_call = lambda *args: PlayHash.get_hash(*args)
+
+        original_play_internal = Scene.play_internal
+
+        def play_internal(scene, skip_rendering=False):
+            if not PlayHash.is_cached_play(scene.renderer):
+                return original_play_internal(scene, skip_rendering)
+            return PlayHash.replay(scene, original_play_internal)
+
+        Scene.play_internal = play_internal
+
+    @staticmethod
+    def is_cached_play(renderer):
+        """Returns whether the renderer skips the current play because its partial movie is cached."""
+        # Plays skipped for any other reason have no hash
+        return bool(renderer.skip_animations and getattr(renderer, "animations_hashes", None) and renderer.animations_hashes[-1] is not None)
+
+    @staticmethod
+    def replay(scene, play_internal):
+        """Runs a cached play with the frame steps of a clean render, advancing the time of each frame without drawing it."""
+        renderer = scene.renderer
+        renderer.skip_animations = False
+        renderer.render = lambda *args: setattr(renderer, "time", renderer.time + 1 / renderer.camera.frame_rate)
+        try:
+            return play_internal(scene)
+        finally:
+            del renderer.render
+            renderer.skip_animations = True
+
+    @classmethod
+    def get_hash(self, scene, camera, animations, mobjects):
+        """Returns the name of the partial movie file of a play."""
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(repr([self.version, config.pixel_width, config.pixel_height, config.frame_rate, str(config.background_color)]).encode())
+        hasher.update(get_source_hash(type(scene).__module__).encode())
+
+        frames = [getattr(c, "frame", None) for c in [camera, getattr(scene, "zoomed_camera", None)]]
+        for mobject in [*mobjects, *[frame for frame in frames if frame is not None]]:
+            seen = set()
+            for member in mobject.get_family():
+                hasher.update(self.get_state(member, family=False).encode())
+                for updater in member.updaters:
+                    hasher.update(self.describe(updater, seen).encode())
+
+        for animation in animations:
+            hasher.update(self.describe(animation, set()).encode())
+
+        return f"updaters{self.version}_{hasher.hexdigest()}"
+
+    @classmethod
+    def get_state(self, mobject, family=True):
+        """Returns a digest of the points, colors and other numeric or string attributes of a mobject."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for member in mobject.get_family() if family else [mobject]:
+            hasher.update(type(member).__qualname__.encode())
+            for name, value in sorted(vars(member).items()):
+                if isinstance(value, np.ndarray) and value.dtype != object:
+                    hasher.update(name.encode())
+                    hasher.update(np.ascontiguousarray(value).tobytes())
+                elif value is None or isinstance(value, (str, int, float, bool)):
+                    hasher.update(f"{name}={value!r}".encode())
+
+        return hasher.hexdigest()
+
+    @classmethod
+    def describe(self, obj, seen):
+        """Returns a stable description of obj and of everything it reads, for updaters and animations."""
+        if id(obj) in seen:
+            return "..."
+        if isinstance(obj, Mobject):
+            return self.get_state(obj)
+        if isinstance(obj, Scene):
+            # Updaters often read the scene, e.g. self.pos, but its mobjects are hashed on their own
+            attributes = {k: v for k, v in vars(obj).items()
+                if v is None or isinstance(v, (str, int, float, bool)) or (isinstance(v, np.ndarray) and v.dtype != object)}
+            return f"{type(obj).__qualname__}{self.describe(attributes, seen)}"
+        if isinstance(obj, (list, tuple)):
+            return "[" + ", ".join(self.describe(i, seen) for i in obj) + "]"
+        if isinstance(obj, dict):
+            return "{" + ", ".join(f"{k!r}: {self.describe(v, seen)}" for k, v in sorted(obj.items(), key=lambda item: repr(item[0]))) + "}"
+        if isinstance(obj, types.MethodType):
+            return f"{get_stable_identity(obj.__func__)} of {self.describe(obj.__self__, seen)}"
+        if isinstance(obj, types.FunctionType):
+            seen.add(id(obj))
+            cells = []
+            for cell in obj.__closure__ or []:
+                try:
+                    cells.append(cell.cell_contents)
+                except ValueError:
+                    cells.append(None)
+            try:
+                resolved_globals = inspect.getclosurevars(obj).globals
+            except (TypeError, ValueError):
+                resolved_globals = {}
+            # Only constants, helpers and mobjects are kept, modules and objects like config or logger are not
+            resolved_globals = {k: v for k, v in resolved_globals.items()
+                if v is None or isinstance(v, (str, int, float, bool, np.ndarray, types.FunctionType, Mobject))}
+            return f"{get_stable_identity(obj)} reading {self.describe(cells, seen)} and {self.describe(resolved_globals, seen)}"
+        if hasattr(obj, "__dict__") and not isinstance(obj, (type, types.ModuleType)):
+            # Updater objects (TrackedUpdater, RadianCircleRig...) and animations. Dicts held by plain
+            # objects are caches and are left out, animations keep theirs (e.g. their kwargs)
+            seen.add(id(obj))
+            attributes = {k: v for k, v in vars(obj).items() if isinstance(obj, Animation) or not isinstance(v, dict)}
+            return f"{type(obj).__qualname__}{self.describe(attributes, seen)}"
+
+        return get_stable_identity(obj)
+
+class TexBatch():
+    """Compiles many tex expressions with a single LaTeX process.
+
+    Every pending expression, and every tex string it is made of, is placed on its own page of
+    one document. The pages are converted to SVG by a single dvisvgm call and the glyphs of each
+    expression are split by tex string the way MathTex does it and stored in the TexCache, so
+    building the MathTex afterwards neither runs LaTeX nor parses an SVG again.
+    """
+    environment = "align*"
+    locks = {}
+    locks_lock = threading.Lock()
+
+    @classmethod
+    def get_lock(self, name):
+        """Returns the lock held while a batch with this name is compiled."""
+        with TexBatch.locks_lock:
+            return TexBatch.locks.setdefault(name, threading.Lock())
+
+    @classmethod
+    def get_page_expression(self, tex_string):
+        """Returns the expression SingleStringMathTex compiles for a tex string.
+
+        Same steps as SingleStringMathTex.modify_special_strings, kept here rather than called
+        on a SingleStringMathTex that was never initialized.
+        """
+        tex = tex_string.strip()
+
+        # A fraction line, sqrt bar, subscript, superscript or dot needs something to go over
+        if tex in ("\\over", "\\overline", "\\sqrt", "\\sqrt{") or tex.endswith(("_", "^", "dot")):
+            tex += "{\\quad}"
+
+        if tex in ("\\substack", ""):
+            tex = "\\quad"
+
+        # Keeps the page from starting with a line break
+        if tex.startswith("\\\\"):
+            tex = tex.replace("\\\\", "\\quad\\\\")
+
+        # Unbalanced \left and \right become \big
+        num_lefts, num_rights = (
+            len([s for s in tex.split(substr)[1:] if s and s[0] in "(){}[]|.\\"])
+            for substr in ("\\left", "\\right"))
+        if num_lefts != num_rights:
+            tex = tex.replace("\\left", "\\big").replace("\\right", "\\big")
+
+        tex = self.remove_stray_braces(tex)
+
+        # An array begun in one tex string and ended in another is left out
+        if ("\\begin{array}" in tex) != ("\\end{array}" in tex):
+            tex = ""
+
+        return tex
+
+    @staticmethod
+    def remove_stray_braces(tex):
+        r"""Balances the braces of a tex string, e.g. of "e^{i" in MathTex(r"e^{i", r"\tau} = 1")."""
+        # "\{" is a brace literal, but "\\{" is a line break followed by a brace
+        num_lefts = tex.count("{") - tex.count("\\{") + tex.count("\\\\{")
+        num_rights = tex.count("}") - tex.count("\\}") + tex.count("\\\\}")
+        if num_rights > num_lefts:
+            tex = "{" * (num_rights - num_lefts) + tex
+        if num_lefts > num_rights:
+            tex = tex + "}" * (num_lefts - num_rights)
+
+        return tex
+
+    @classmethod
+    def get_compilation_command(self, tex_template, tex_file, tex_dir):
+        """Returns the command compiling tex_file into tex_dir with the compiler of tex_template."""
+        if tex_template.tex_compiler == "xelatex":
+            if tex_template.output_format not in (".xdv", ".pdf"):
+                raise ValueError("xelatex output is either pdf or xdv")
+            flags = ["-no-pdf"] if tex_template.output_format == ".xdv" else []
+        else:
+            flags = [f"-output-format={tex_template.output_format[1:]}"]
+
+        return [tex_template.tex_compiler, *flags, "-interaction=batchmode", "-halt-on-error",
+            f"-output-directory={tex_dir}", tex_file]
+
+    @staticmethod
+    def load_page(svg_path):
+        """Returns the glyphs of a page SVG, placed and scaled like SingleStringMathTex places them."""
+        page = SVGMobject(svg_path, should_center=True, height=None, stroke_width=0, fill_opacity=1.0,
+            should_subdivide_sharp_curves=True, should_remove_null_curves=True)
+        return page.scale(DEFAULT_FONT_SIZE * SCALE_FACTOR_PER_FONT_POINT)
+
+    @staticmethod
+    def split(glyphs, substring_sizes):
+        """Groups the glyphs of a whole expression by tex string, like MathTex.break_up_by_substrings."""
+        tex = VGroup()
+        start = 0
+        for size in substring_sizes:
+            if size:
+                tex.add(VGroup(*glyphs[start:start + size]))
+            else:
+                # Empty tex strings become a point at the right of the previous glyph
+                anchor = glyphs[min(start, len(glyphs) - 1)].get_right() if glyphs else ORIGIN
+                tex.add(VGroup(VectorizedPoint(anchor)))
+            start += size
+
+        return tex
+
+    @classmethod
+    def compile(self, tex_args, tex_template=segoe_template):
+        """Compiles every expression that has no TexCache entry yet in one LaTeX run.
+
+        If the batch fails, nothing is stored and each MathTex compiles (and reports
+        errors for) its own expression as usual. Tex strings using the double brace
+        notation are left to MathTex, since it splits them further.
+
+        Parameters
+        -----------
+        tex_args : list
+            A list of tuples of tex strings, one tuple for each MathTex.
+        tex_template : TexTemplate
+            The template used to compile the expressions.
+
+        Returns
+        -----------
+        None
+        """
+        pending = {}
+        for tex_strings in tex_args:
+            key = TexCache.get_key(tex_strings, tex_template)
+            if key not in pending and "{{" not in "".join(tex_strings) and not os.path.exists(TexCache.get_path(key)):
+                pending[key] = tex_strings
+
+        if not pending:
+            return
+
+        pages = {}
+        for tex_strings in pending.values():
+            for tex_string in (" ".join(tex_strings), *tex_strings):
+                pages.setdefault(self.get_page_expression(tex_string), len(pages) + 1)
+
+        tex_dir = config.get_dir("tex_dir")
+        os.makedirs(tex_dir, exist_ok=True)
+
+        begin, end = r"\begin{" + self.environment + "}", r"\end{" + self.environment + "}"
+        document = "\n\\newpage\n".join(f"{begin}\n{expression}\n{end}" for expression in pages)
+
+        # dvisvgm crops every page to its glyphs, so a plain multi-page class replaces standalone
+        body = tex_template.body.replace(tex_template.documentclass, "\\documentclass{article}\n\\pagestyle{empty}")
+        body = body.replace(tex_template.placeholder_text, document)
+
+        name = "batch_" + tex_hash(body)
+        with self.get_lock(name):
+            # A batch with the same name may have stored every entry while this one waited
+            if all(os.path.exists(TexCache.get_path(key)) for key in pending):
+                return
+
+            # Every process compiles in its own directory, only the TexCache entries are shared
+            with tempfile.TemporaryDirectory(dir=tex_dir, prefix=name + "-") as work_dir:
+                tex_file = os.path.join(work_dir, name + ".tex")
+                with open(tex_file, "w", encoding="utf-8") as f:
+                    f.write(body)
+
+                command = self.get_compilation_command(tex_template, tex_file, work_dir)
+                if subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode != 0:
+                    return
+
+                dvi_file = os.path.join(work_dir, name + tex_template.output_format)
+                subprocess.run(
+                    ["dvisvgm", *(["--pdf"] if tex_template.output_format == ".pdf" else []), "-p", "1-", "-n", "-v", "0",
+                        "-o", os.path.join(work_dir, name + "-%p.svg"), dvi_file],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+                glyphs = {}
+                for entry in os.scandir(work_dir):
+                    match = re.fullmatch(re.escape(name) + r"-0*(\d+)\.svg", entry.name)
+                    if match:
+                        glyphs[int(match.group(1))] = self.load_page(entry.path).submobjects
+
+            for key, tex_strings in pending.items():
+                expressions = [self.get_page_expression(tex_string) for tex_string in (" ".join(tex_strings), *tex_strings)]
+                if all(pages[expression] in glyphs for expression in expressions):
+                    tex = self.split(glyphs[pages[expressions[0]]], [len(glyphs[pages[expression]]) for expression in expressions[1:]])
+                    TexCache.store(key, TexCache.extract(tex))
+
+class TexCache():
+    """A persistent, content-addressed cache of compiled MathTex path data.
+
+    Entries are keyed by a hash of the tex template and the tex strings and hold the points of
+    every glyph, so a hit skips both the LaTeX compilation and the SVG parsing. The least
+    recently used entries are evicted once the cache grows above max_size bytes.
+    """
+    directory = None
+    max_size = 64 * 1024 * 1024
+    version = 1
+
+    @classmethod
+    def get_directory(self):
+        """Returns directory when set, the tex_cache folder of the current media directory otherwise."""
+        return self.directory or os.path.join(config.media_dir, "tex_cache")
+
+    @classmethod
+    def get_key(self, tex_strings, tex_template):
+        """Returns the hash identifying the tex strings compiled with tex_template."""
+        content = "\0".join([
+            str(self.version),
+            tex_template.tex_compiler,
+            tex_template.output_format,
+            tex_template.preamble,
+            tex_template.body,
+            *tex_strings
+            ])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get_path(self, key):
+        return os.path.join(self.get_directory(), key + ".npz")
+
+    @classmethod
+    def math_tex(self, *tex_strings, tex_template=segoe_template, color=WHITE, stroke_width=0, fill_opacity=1.0):
+        """Returns a MathTex-like VGroup, loading its glyphs from the cache when possible.
+
+        The group is not a MathTex: it has the tex_strings and tex_string attributes and one
+        submobject for each tex string, but none of the MathTex methods such as get_part_by_tex,
+        set_color_by_tex or index_of_part. Index its submobjects by the position of the tex
+        string instead, or build a MathTex where those methods are needed.
+
+        Parameters
+        -----------
+        tex_strings : str
+            The tex strings, one submobject is created for each of them, like MathTex does.
+        tex_template : TexTemplate
+            The template used to compile the tex strings.
+        color : str
+            The color of the glyphs.
+        stroke_width : float
+            The stroke width of the glyphs.
+        fill_opacity : float
+            The fill opacity of the glyphs.
+
+        Returns
+        -----------
+        VGroup
+            A group with one VGroup of glyphs for each tex string, not a MathTex.
+        """
+        key = self.get_key(tex_strings, tex_template)
+        data = self.load(key)
+
+        if data is None:
+            data = self.extract(MathTex(*tex_strings, tex_template=tex_template))
+            self.store(key, data)
+
+        tex = self.build(data)
+        tex.tex_strings = list(tex_strings)
+        tex.tex_string = " ".join(tex_strings)
+        tex.set_style(fill_color=color, fill_opacity=fill_opacity, stroke_color=color, stroke_width=stroke_width)
+
+        return Draft.stand_in(tex)
+
+    @classmethod
+    def math_tex_batch(self, tex_args, tex_template=segoe_template, **kwargs):
+        """Returns a list of MathTex-like VGroups, compiling every cache miss in a single LaTeX run.
+
+        The groups are built by math_tex and lack the MathTex methods in the same way.
+
+        Parameters
+        -----------
+        tex_args : list
+            A list of tuples of tex strings, one tuple for each MathTex.
+        tex_template : TexTemplate
+            The template used to compile the tex strings.
+        kwargs
+            The style passed to math_tex.
+
+        Returns
+        -----------
+        list
+            The groups in the same order as tex_args.
+        """
+        misses = [tex_strings for tex_strings in tex_args if not os.path.exists(self.get_path(self.get_key(tex_strings, tex_template)))]
+        TexBatch.compile(misses, tex_template)
+
+        return [self.math_tex(*tex_strings, tex_template=tex_template, **kwargs) for tex_strings in tex_args]
+
+    @staticmethod
+    def extract(tex):
+        """Returns the path data of a MathTex as a dict of arrays."""
+        glyphs = [[glyph.points for glyph in sub.family_members_with_points()] for sub in tex.submobjects]
+        all_glyphs = [g for sub in glyphs for g in sub]
+
+        return {
+            "points": np.concatenate(all_glyphs) if all_glyphs else np.zeros((0, 3)),
+            "glyph_sizes": np.array([len(g) for g in all_glyphs], dtype=np.int64),
+            "substring_sizes": np.array([len(sub) for sub in glyphs], dtype=np.int64),
+            "anchors": np.array([sub.get_center() for sub in tex.submobjects]).reshape(-1, 3),
+            }
+
+    @staticmethod
+    def build(data):
+        """Builds a MathTex-like VGroup from path data."""
+        glyph_points = np.split(data["points"], np.cumsum(data["glyph_sizes"])[:-1]) if len(data["glyph_sizes"]) else []
+        glyphs = [VectorizedPoint(p[0]) if len(p) == 1 else VMobject().set_points(p) for p in glyph_points]
+
+        tex = VGroup()
+        start = 0
+        for size, anchor in zip(data["substring_sizes"], data["anchors"]):
+            sub = VGroup(*glyphs[start:start + size]) if size else VGroup(VectorizedPoint(anchor))
+            tex.add(sub)
+            start += size
+
+        return tex
+
+    @classmethod
+    def load(self, key):
+        """Returns the cached path data for key, or None on a miss."""
+        path = self.get_path(key)
+        try:
+            with np.load(path) as f:
+                data = {name: f[name] for name in f.files}
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # Mark the entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return data
+
+    @classmethod
+    def store(self, key, data):
+        """Writes the path data of key to the cache and evicts old entries if it grew too big."""
+        os.makedirs(self.get_directory(), exist_ok=True)
+
+        # Write to a temporary file first so concurrent renders never read a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.get_directory(), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **data)
+        os.replace(tmp_path, self.get_path(key))
+
+        self.evict()
+
+    @classmethod
+    def evict(self):
+        """Removes the least recently used entries until the cache fits in max_size."""
+        entries = []
+        for entry in os.scandir(self.get_directory()):
+            if entry.name.endswith(".npz"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(e[1] for e in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= entry_size
+
+    @classmethod
+    def clear(self):
+        """Removes every entry of the cache."""
+        if not os.path.isdir(self.get_directory()):
+            return
+        for entry in os.scandir(self.get_directory()):
+            if entry.name.endswith(".npz"):
+                os.remove(entry.path)
+
+    @classmethod
+    def warm(self, scene_classes=None):
+        """Fills the cache by running the construct method of every scene without rendering any frame.
+
+        Parameters
+        -----------
+        scene_classes : list
+            The scenes to warm the cache for. Defaults to every scene in this module.
+
+        Returns
+        -----------
+        None
+        """
+        if scene_classes is None:
+            scene_classes = get_scene_classes()
+
+        with tempconfig({"dry_run": True}):
+            for scene_class in scene_classes:
+                scene_class(renderer=CairoRenderer(skip_animations=True)).render()
+
+        # Pool workers exit without running atexit handlers
+        GlyphStore.save()
+
+class LazyMathTex(VGroup):
+    """A placeholder for a TexCache MathTex whose LaTeX compilation runs in a background thread.
+
+    The compilation is submitted when the placeholder is declared. Positioning calls are
+    recorded and replayed once the MathTex is resolved, which happens the first time its
+    glyphs are needed (indexing, iterating, copying or adding it to a scene). Arguments of
+    recorded calls that are callables are evaluated on resolution, so a placeholder can be
+    positioned relative to another one without resolving it, e.g. move_to(lambda: eq[4]).
+    """
+    executor = None
+    compiling = {}
+    lock = threading.Lock()
+
+    def __init__(self, *tex_strings, tex_template=segoe_template, **kwargs):
+        """
+        Parameters
+        -----------
+        tex_strings : str
+            The tex strings, as in MathTex.
+        tex_template : TexTemplate
+            The template used to compile the tex strings.
+        kwargs
+            The style passed to TexCache.math_tex.
+        """
+        super().__init__()
+        self.tex_strings = tex_strings
+        self.tex_template = tex_template
+        self.tex_kwargs = kwargs
+        self.deferred_calls = []
+        self.future = None
+
+        key = TexCache.get_key(tex_strings, tex_template)
+        if not os.path.exists(TexCache.get_path(key)):
+            self.future = self.submit(key, tex_strings, tex_template)
+
+        self.resolved = False
+
+    @classmethod
+    def get_executor(self):
+        if LazyMathTex.executor is None:
+            LazyMathTex.executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        return LazyMathTex.executor
+
+    @classmethod
+    def submit(self, key, tex_strings, tex_template):
+        """Returns the future compiling the tex strings, shared by every placeholder of the same expression."""
+        with LazyMathTex.lock:
+            future = LazyMathTex.compiling.get(key)
+            if future is None:
+                future = self.get_executor().submit(TexBatch.compile, [tex_strings], tex_template)
+                LazyMathTex.compiling[key] = future
+                future.add_done_callback(lambda _: LazyMathTex.compiling.pop(key, None))
+        return future
+
+    def resolve(self):
+        """Waits for the compilation, builds the glyphs and replays the recorded calls."""
+        if getattr(self, "resolved", True):
+            return self
+        self.resolved = True
+
+        if self.future is not None:
+            self.future.result()
+            self.future = None
+
+        tex = TexCache.math_tex(*self.tex_strings, tex_template=self.tex_template, **self.tex_kwargs)
+        self.add(*tex.submobjects)
+        self.tex_string = tex.tex_string
+
+        for name, args, kwargs in self.deferred_calls:
+            args = [arg() if callable(arg) else arg for arg in args]
+            getattr(self, name)(*args, **kwargs)
+        self.deferred_calls = []
+
+        return self
+
+    def defer(self, name, args, kwargs):
+        if getattr(self, "resolved", True):
+            return getattr(super(), name)(*args, **kwargs)
+        self.deferred_calls.append((name, args, kwargs))
+        return self
+
+    def scale(self, *args, **kwargs):
+        return self.defer("scale", args, kwargs)
+
+    def shift(self, *args, **kwargs):
+        return self.defer("shift", args, kwargs)
+
+    def move_to(self, *args, **kwargs):
+        return self.defer("move_to", args, kwargs)
+
+    def next_to(self, *args, **kwargs):
+        return self.defer("next_to", args, kwargs)
+
+    def to_edge(self, *args, **kwargs):
+        return self.defer("to_edge", args, kwargs)
+
+    def get_family(self, *args, **kwargs):
+        self.resolve()
+        return super().get_family(*args, **kwargs)
+
+    def copy(self):
+        self.resolve()
+        return super().copy()
+
+    def __getitem__(self, value):
+        self.resolve()
+        return super().__getitem__(value)
+
+    def __iter__(self):
+        self.resolve()
+        return super().__iter__()
+
+    def __len__(self):
+        self.resolve()
+        return super().__len__()
+
+class GlyphStore():
+    """A persistent store of glyph outlines and pair offsets used to assemble Text without Pango.
+
+    Each glyph outline is laid out once per font and the offset between two consecutive glyphs
+    (including kerning and the whitespace between them) once per pair. Outlines are saved in a
+    .npy file that is memory-mapped by every process reading the store, and new glyphs are
+    merged into it when the process exits.
+    """
+    directory = None
+    version = 1
+    stores = {}
+
+    @classmethod
+    def get_directory(self):
+        """Returns directory when set, the glyph_store folder of the current media directory otherwise."""
+        return self.directory or os.path.join(config.media_dir, "glyph_store")
+
+    @classmethod
+    def text(self, string, font="Segoe UI Light", color=WHITE, stroke_width=0, fill_opacity=1.0):
+        """Returns a Text-like VGroup with one glyph for each non whitespace character.
+
+        Parameters
+        -----------
+        string : str
+            The text to show.
+        font : str
+            The font of the text.
+        color : str
+            The color of the glyphs.
+        stroke_width : float
+            The stroke width of the glyphs.
+        fill_opacity : float
+            The fill opacity of the glyphs.
+
+        Returns
+        -----------
+        VGroup
+            The glyphs, centered like Text does.
+        """
+        store = self.get_store(font)
+        chars = [(m.start(), m.group()) for m in re.finditer(r"\S", string)]
+
+        glyphs = []
+        position = np.zeros(3)
+        for i, (start, char) in enumerate(chars):
+            if i:
+                previous_start, previous_char = chars[i - 1]
+                offset = self.get_pair_offset(store, font, string[previous_start:start + 1])
+                if offset is None:
+                    return Draft.stand_in(Text(string, font=font, color=color, stroke_width=stroke_width, fill_opacity=fill_opacity))
+                position = position + offset
+
+            outline = self.get_outline(store, font, char)
+            if outline is None:
+                return Draft.stand_in(Text(string, font=font, color=color, stroke_width=stroke_width, fill_opacity=fill_opacity))
+            glyphs.append(VMobject().set_points(outline + position))
+
+        text = VGroup(*glyphs).center()
+        text.set_style(fill_color=color, fill_opacity=fill_opacity, stroke_color=color, stroke_width=stroke_width)
+        text.text = string
+
+        return Draft.stand_in(text)
+
+    @classmethod
+    def get_outline(self, store, font, char):
+        """Returns the outline of char relative to its lower left corner, laying it out if needed."""
+        if char not in store["new_glyphs"] and char not in store["glyphs"]:
+            self.learn(store, font, char)
+
+        if char in store["new_glyphs"]:
+            return store["new_glyphs"][char]
+        if char in store["glyphs"]:
+            start, length = store["glyphs"][char]
+            return store["outlines"][start:start + length]
+
+        return None
+
+    @classmethod
+    def get_pair_offset(self, store, font, pair):
+        """Returns the offset between the lower left corners of the first and last glyph of pair."""
+        if pair not in store["pairs"]:
+            self.learn(store, font, pair)
+
+        offset = store["pairs"].get(pair)
+        return None if offset is None else np.array((*offset, 0))
+
+    @classmethod
+    def learn(self, store, font, string):
+        """Lays out string once with Pango and stores its glyph outlines and pair offset."""
+        text = Text(string, font=font)
+        chars = [string] if len(string) == 1 else [string[0], string[-1]]
+
+        if len(text.submobjects) != len(chars) or any(len(glyph.points) == 0 for glyph in text.submobjects):
+            return
+
+        corners = [glyph.points.min(axis=0) for glyph in text.submobjects]
+        for char, glyph, corner in zip(chars, text.submobjects, corners):
+            if char not in store["glyphs"] and char not in store["new_glyphs"]:
+                store["new_glyphs"][char] = glyph.points - corner
+
+        if len(chars) == 2:
+            store["pairs"][string] = list((corners[1] - corners[0])[:2])
+
+        self.mark_dirty(store)
+
+    @classmethod
+    def get_key(self, font):
+        return hashlib.sha256(f"{self.version}\0{font}".encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def get_store(self, font):
+        """Returns the store of font, memory-mapping its outlines from disk on first use."""
+        if font not in self.stores:
+            index = self.read_index(font)
+            self.stores[font] = {
+                "outlines": self.map_outlines(index),
+                "glyphs": index["glyphs"],
+                "pairs": index["pairs"],
+                "new_glyphs": {},
+                "dirty": False,
+                }
+        return self.stores[font]
+
+    @classmethod
+    def read_index(self, font):
+        try:
+            with open(os.path.join(self.get_directory(), self.get_key(font) + ".json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"outlines": None, "glyphs": {}, "pairs": {}}
+
+    @classmethod
+    def map_outlines(self, index):
+        if index["outlines"] is None:
+            return np.zeros((0, 3))
+        try:
+            return np.load(os.path.join(self.get_directory(), index["outlines"]), mmap_mode="r")
+        except (OSError, ValueError):
+            index["glyphs"] = {}
+            return np.zeros((0, 3))
+
+    @classmethod
+    def mark_dirty(self, store):
+        if not any(s["dirty"] for s in self.stores.values()):
+            atexit.register(self.save)
+        store["dirty"] = True
+
+    @classmethod
+    def save(self):
+        """Merges the glyphs and pairs learned by this process into the stores on disk.
+
+        Saves of concurrent processes are serialized by a lock file, so none of them drops the
+        glyphs another one merged, and outlines files no index refers to anymore are removed.
+        """
+        directory = self.get_directory()
+        os.makedirs(directory, exist_ok=True)
+
+        with open(os.path.join(directory, "save.lock"), "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+
+            for font, store in self.stores.items():
+                if store["dirty"]:
+                    self.merge(directory, font, store)
+
+            # Processes that mapped an outlines file keep reading it until they exit
+            referenced = set()
+            for entry in os.scandir(directory):
+                if entry.name.endswith(".json"):
+                    try:
+                        with open(entry.path, encoding="utf-8") as f:
+                            referenced.add(json.load(f)["outlines"])
+                    except (OSError, ValueError, KeyError):
+                        continue
+            for entry in os.scandir(directory):
+                if entry.name.endswith(".npy") and entry.name not in referenced:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+    @classmethod
+    def merge(self, directory, font, store):
+        """Writes the store of font merged with the one on disk and points the index to it."""
+        index = self.read_index(font)
+        disk_outlines = self.map_outlines(index)
+
+        outlines = [disk_outlines]
+        glyphs = dict(index["glyphs"])
+        length = len(disk_outlines)
+        for char, outline in [*((c, store["outlines"][s:s + l]) for c, (s, l) in store["glyphs"].items()), *store["new_glyphs"].items()]:
+            if char not in glyphs:
+                glyphs[char] = (length, len(outline))
+                outlines.append(np.asarray(outline))
+                length += len(outline)
+
+        # Outlines are named by content, so saving the same glyphs twice writes a single file
+        outlines = np.ascontiguousarray(np.concatenate(outlines))
+        outlines_name = self.get_key(font) + "-" + hashlib.sha256(outlines.tobytes()).hexdigest()[:16] + ".npy"
+        fd, outlines_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, outlines)
+        os.replace(outlines_path, os.path.join(directory, outlines_name))
+
+        new_index = {
+            "outlines": outlines_name,
+            "glyphs": glyphs,
+            "pairs": {**store["pairs"], **index["pairs"]},
+            }
+        fd, index_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(new_index, f)
+        os.replace(index_path, os.path.join(directory, self.get_key(font) + ".json"))
+
+        store["dirty"] = False
+
+class LabelCache():
+    """A bounded LRU cache of labels keyed by the strings they display and their style.
+
+    Labels rebuilt on every frame only change when their rounded value does, so each displayed
+    value is built once and every frame gets a copy of it to position.
+    """
+    max_size = 512
+    labels = {}
+
+    @classmethod
+    def get(self, key, build):
+        """Returns a copy of the label cached for key, building it first on a miss.
+
+        Parameters
+        -----------
+        key : tuple
+            Every string and setting the label depends on.
+        build : Callable
+            Builds the label when it is not cached.
+
+        Returns
+        -----------
+        Mobject
+            A copy of the label, free to be positioned and restyled.
+        """
+        # Drafts cache their stand-ins apart from the real labels
+        key = (Draft.enabled, *key)
+        # Dicts keep insertion order, so the first key is the least recently used one
+        label = self.labels.pop(key, None)
+        if label is None:
+            label = Draft.stand_in(build())
+            if len(self.labels) >= self.max_size:
+                del self.labels[next(iter(self.labels))]
+        self.labels[key] = label
+
+        return label.copy()
+
+class TrackedUpdater():
+    """An updater that declares the ValueTrackers it reads and only runs on frames where one of them changed.
+
+    The first call always runs the updater. Suspending and resuming is unnecessary for speed:
+    once TrackedUpdater.install() is called, every play parks the tracked updaters of mobjects
+    whose trackers it cannot change, so manim draws those mobjects into the static frame of the
+    play (and freezes waits) instead of redrawing them every frame. A mobject that is part of an
+    animation runs its tracked updaters on every frame of the play, like plain updaters, so it
+    snaps back after an animation moved it.
+    """
+    animated = set()
+    parked = []
+    original_compile_animation_data = None
+    def __init__(self, updater, *trackers):
+        """
+        Parameters
+        -----------
+        updater : Callable
+            The updater, taking only the mobject.
+        trackers : ValueTracker
+            The ValueTrackers read by the updater.
+        """
+        self.updater = updater
+        self.trackers = trackers
+        self.last_values = None
+
+    def __call__(self, mobject):
+        values = tuple(tracker.get_value() for tracker in self.trackers)
+        if values == self.last_values and id(mobject) not in TrackedUpdater.animated:
+            return mobject
+        self.last_values = values
+        return self.updater(mobject)
+
+    def __deepcopy__(self, memo):
+        # Copies of a mobject keep reading the same trackers
+        return TrackedUpdater(self.updater, *self.trackers)
+
+    def is_idle(self, changing):
+        """Returns whether the updater already ran with the current values of trackers that cannot change."""
+        return (self.last_values == tuple(tracker.get_value() for tracker in self.trackers)
+            and not any(id(tracker) in changing for tracker in self.trackers))
+
+    @classmethod
+    def install(self):
+        """Makes every Scene.play park idle tracked updaters and force those of animated mobjects."""
+        if self.original_compile_animation_data is not None:
+            return
+
+        self.original_compile_animation_data = Scene.compile_animation_data
+        original_play = Scene.play
+
+        def compile_animation_data(scene, *animations, **play_kwargs):
+            animations = scene.compile_animations(*animations, **play_kwargs)
+            TrackedUpdater.park(scene, animations)
+            return TrackedUpdater.original_compile_animation_data(scene, *animations, **play_kwargs)
+
+        def play(scene, *args, **kwargs):
+            try:
+                return original_play(scene, *args, **kwargs)
+            finally:
+                TrackedUpdater.unpark()
+
+        Scene.compile_animation_data = compile_animation_data
+        Scene.play = play
+
+    @staticmethod
+    def is_opaque(animation):
+        """Returns whether an animation may change anything, e.g. a ValueTracker, through a function."""
+        if isinstance(animation, AnimationGroup):
+            return any(TrackedUpdater.is_opaque(a) for a in animation.animations)
+        return isinstance(animation, UpdateFromFunc)
+
+    @classmethod
+    def park(self, scene, animations):
+        """Marks the mobjects of the animations and detaches the idle tracked updaters of every other mobject."""
+        members = scene.get_mobject_family_members()
+        animated = {id(m) for animation in animations if animation.mobject is not None for m in animation.mobject.get_family()}
+        # A group is changed by the animation of any of its members
+        changing = animated | {id(m) for m in members if any(id(member) in animated for member in m.get_family())}
+        TrackedUpdater.animated = changing
+
+        # Plain updaters and function animations may set any ValueTracker
+        updaters = [getattr(u, "__wrapped__", u) for m in members for u in m.updaters]
+        if any(self.is_opaque(animation) for animation in animations) or not all(isinstance(u, TrackedUpdater) for u in updaters):
+            return
+
+        for m in members:
+            if m.updaters and id(m) not in changing and all(getattr(u, "__wrapped__", u).is_idle(changing) for u in m.updaters):
+                TrackedUpdater.parked.append((m, m.updaters))
+                m.updaters = []
+
+    @classmethod
+    def unpark(self):
+        """Reattaches the updaters detached for the play that just ended."""
+        for mobject, updaters in TrackedUpdater.parked:
+            mobject.updaters = updaters + mobject.updaters
+        TrackedUpdater.parked = []
+        TrackedUpdater.animated = set()
+
+class ProfiledUpdater():
+    """An updater wrapped by UpdaterProfiler, adding its run time to the entry of its component."""
+    def __init__(self, updater, entry):
+        # Mobject.update inspects the signature, which follows __wrapped__ to the updater's own
+        self.__wrapped__ = updater
+        self.entry = entry
+
+    def __call__(self, *args):
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            return self.__wrapped__(*args)
+        finally:
+            self.entry["seconds"] += time.perf_counter() - start
+            self.entry["calls"] += 1
+            self.entry["allocated_blocks"] += sys.getallocatedblocks() - blocks
+
+    def __deepcopy__(self, memo):
+        # Copies keep their own updater state but report to the same component
+        return ProfiledUpdater(copy.deepcopy(self.__wrapped__, memo), self.entry)
+
+class UpdaterProfiler():
+    """Opt-in instrumentation of every updater, reporting where the frame time goes at the end of each scene.
+
+    Once installed, add_updater wraps its callback and attributes it to a component, named
+    after the class and the local variable holding the mobject (e.g. RadianCircle.arc_arrow),
+    and to the function of this module that added it. Calls, cumulative time and net allocated
+    memory blocks are summed per component. Install it with UpdaterProfiler.install(), by passing
+    --profile-updaters or by setting the PROFILE_UPDATERS environment variable, which
+    install_patches reads.
+    """
+    entries = {}
+    installed = False
+    # Local variable names that say nothing about the component
+    generic_names = {"m", "mob", "mobject", "self", "i"}
+
+    @classmethod
+    def install(self):
+        """Wraps Mobject.add_updater and Mobject.remove_updater and makes Scene.render report at its end."""
+        if self.installed:
+            return
+        self.installed = True
+
+        original_add_updater = Mobject.add_updater
+        original_remove_updater = Mobject.remove_updater
+        original_render = Scene.render
+
+        def add_updater(mobject, update_function, *args, **kwargs):
+            return original_add_updater(mobject, ProfiledUpdater(update_function, self.get_entry(mobject)), *args, **kwargs)
+
+        def remove_updater(mobject, update_function):
+            for updater in [u for u in mobject.updaters if getattr(u, "__wrapped__", None) is update_function]:
+                original_remove_updater(mobject, updater)
+            return original_remove_updater(mobject, update_function)
+
+        def render(scene, *args, **kwargs):
+            self.entries = {}
+            try:
+                return original_render(scene, *args, **kwargs)
+            finally:
+                self.report(scene.__class__.__name__)
+
+        Mobject.add_updater = add_updater
+        Mobject.remove_updater = remove_updater
+        Scene.render = render
+
+    @classmethod
+    def get_entry(self, mobject):
+        """Returns the statistics of the component an updater is being added to, creating them if needed."""
+        # Attribute the updater to the innermost caller in this module rather than to manim
+        frame = sys._getframe(2)
+        caller = frame
+        while frame is not None and frame.f_globals.get("__name__") != __name__:
+            frame = frame.f_back
+        frame = frame or caller
+
+        code = frame.f_code
+        owner = frame.f_locals.get("self")
+        if owner is None:
+            owner_name = getattr(code, "co_qualname", code.co_name).split(".")[0]
+        else:
+            owner_name = owner.__name__ if isinstance(owner, type) else type(owner).__name__
+
+        names = [name for name, value in frame.f_locals.items() if value is mobject and name not in self.generic_names]
+        if names:
+            component = f"{owner_name}.{names[0]}"
+        elif mobject is owner:
+            component = owner_name
+        else:
+            component = f"{owner_name}.{type(mobject).__name__}:{frame.f_lineno}"
+
+        creator = f"{getattr(code, 'co_qualname', code.co_name)} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+        key = (component, creator)
+        if key not in self.entries:
+            self.entries[key] = {"component": component, "creator": creator, "calls": 0, "seconds": 0, "allocated_blocks": 0}
+
+        return self.entries[key]
+
+    @classmethod
+    def report(self, scene_name):
+        """Logs the components sorted by cumulative time and writes them as JSON to the media directory.
+
+        Returns
+        -----------
+        list
+            The statistics of every component, slowest first.
+        """
+        entries = sorted(self.entries.values(), key=lambda entry: entry["seconds"], reverse=True)
+
+        lines = [f"Updater profile of {scene_name}", f"{'seconds':>10} {'calls':>8} {'ms/call':>8} {'blocks':>10}  component (creator)"]
+        for entry in entries:
+            per_call = 1000 * entry["seconds"] / entry["calls"] if entry["calls"] else 0
+            lines.append(f"{entry['seconds']:>10.3f} {entry['calls']:>8} {per_call:>8.3f} {entry['allocated_blocks']:>10}  {entry['component']} ({entry['creator']})")
+        logger.info("\n".join(lines))
+
+        directory = os.path.join(config.media_dir, "updater_profiles")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, scene_name + ".json"), "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=4)
+
+        return entries
+
+class Reconfigurable():
+    """Mixin for Line, Arrow and Arc that regenerates their points in place and moves their existing tips.
+
+    Updaters that only move an endpoint or change an angle keep the same mobject, with its style,
+    z_index and tips, instead of building a new one with its tips for become() every frame.
+    """
+    def reconfigure(self):
+        """Regenerates the points from the current attributes and puts the tips back at the new ends."""
+        tips = [(tip, at_start) for tip, at_start, present in [
+            (getattr(self, "tip", None), False, self.has_tip()),
+            (getattr(self, "start_tip", None), True, self.has_start_tip())] if present]
+
+        # Tips are detached so that generate_points neither scales nor shifts them
+        self.remove(*[tip for tip, _ in tips])
+        self.generate_points()
+        for tip, at_start in tips:
+            self.add_tip(tip=self.fit_tip(tip), at_start=at_start)
+
+        return self
+
+    def fit_tip(self, tip):
+        """Returns the tip resized for the regenerated points, the tips of Line and Arc keep their size."""
+        return tip
+
+class ReconfigurableLine(Reconfigurable, Line):
+    """A Line whose endpoints can be moved in place."""
+    def set_endpoints(self, start, end):
+        """Moves the line to go from start to end.
+
+        Parameters
+        -----------
+        start : np.array | Mobject
+            The new start.
+        end : np.array | Mobject
+            The new end.
+
+        Returns
+        -----------
+        ReconfigurableLine
+            The line itself.
+        """
+        self.set_start_and_end_attrs(start, end)
+        return self.reconfigure()
+
+class ReconfigurableArrow(Reconfigurable, Arrow):
+    """An Arrow whose endpoints can be moved in place. The tip is resized like Arrow.__init__ sizes it."""
+    def set_endpoints(self, start, end):
+        """Moves the arrow to go from start to end.
+
+        Parameters
+        -----------
+        start : np.array | Mobject
+            The new start.
+        end : np.array | Mobject
+            The new end.
+
+        Returns
+        -----------
+        ReconfigurableArrow
+            The arrow itself.
+        """
+        self.set_start_and_end_attrs(start, end)
+        self.reconfigure()
+        # Same thinning of short arrows as Arrow.__init__
+        return self.set_stroke_width_from_length()
+
+    def fit_tip(self, tip):
+        # Same shortening of the tips of short arrows (max_tip_length_to_length_ratio) as Arrow.__init__
+        if tip.length > 0:
+            tip.scale(self.get_default_tip_length() / tip.length)
+        return tip
+
+class ReconfigurableArc(Reconfigurable, Arc):
+    """An Arc whose angle, radius and center can be changed in place."""
+    def set_arc(self, angle=None, radius=None, center=None):
+        """Changes the arc, keeping what is not given.
+
+        Parameters
+        -----------
+        angle : float
+            The new angle.
+        radius : float
+            The new radius.
+        center : np.array
+            The new center.
+
+        Returns
+        -----------
+        ReconfigurableArc
+            The arc itself.
+        """
+        if angle is not None:
+            self.angle = angle
+        if radius is not None:
+            self.radius = radius
+        if center is not None:
+            self.arc_center = center
+
+        return self.reconfigure()
+
+class RadianCircleRig():
+    """Computes the points of every geometric RadianCircle component in a single NumPy pass.
+
+    The solution is cached by (angle, radius, center), so the first component updated in a
+    frame solves the whole rig and the remaining ones only copy their points into their
+    existing arrays.
+    """
+    def __init__(self, angle_func, radius_func, center_func, center_dot_radius=DEFAULT_DOT_RADIUS/2, tip_length=0.1,
+        theta_radius=0.1 + 3 * SMALL_BUFF):
+        """
+        Parameters
+        -----------
+        angle_func : Callable
+            Returns the current angle.
+        radius_func : Callable
+            Returns the current radius of the circle.
+        center_func : Callable
+            Returns the current center of the circle.
+        center_dot_radius : float
+            The radius of the dot at the center of the circle.
+        tip_length : float
+            The length of the tip of the arc.
+        theta_radius : float
+            The radius of the angle where the theta label is placed.
+        """
+        self.angle_func = angle_func
+        self.radius_func = radius_func
+        self.center_func = center_func
+        self.theta_radius = theta_radius
+
+        circle = Circle(radius=1)
+        dot = Dot()
+        center_dot = Dot(radius=center_dot_radius)
+        arc = Arc(angle=PI).add_tip(tip_length=tip_length)
+        tip = arc.submobjects[0]
+
+        self.unit_circle = circle.points - circle.get_center()
+        self.dot_template = dot.points - dot.get_center()
+        self.center_dot_template = center_dot.points - center_dot.get_center()
+        self.arc_components = len(arc.points) // 4 + 1
+        self.tip_template = self.rotate_points(tip.points - tip.tip_point, -tip.tip_angle)
+
+        self._key = None
+        self._points = {
+            "circle": np.zeros_like(circle.points),
+            "fixed_segment": np.zeros((4, 3)),
+            "rotating_segment": np.zeros((4, 3)),
+            "dot": np.zeros_like(dot.points),
+            "center_dot": np.zeros_like(center_dot.points),
+            "arc_arrow": np.zeros(((self.arc_components - 1) * 4, 3)),
+            "tip": np.zeros_like(tip.points),
+            "theta": np.zeros(3),
+            }
+
+    @staticmethod
+    def rotate_points(points, angle):
+        """Returns the points rotated by angle around the origin in the xy plane."""
+        c, s = np.cos(angle), np.sin(angle)
+        return points @ np.array([[c, s, 0], [-s, c, 0], [0, 0, 1]])
+
+    @staticmethod
+    def line_points(start, end, out):
+        """Writes the points of a straight line from start to end into out."""
+        out[:] = start + np.linspace(0, 1, 4)[:, None] * (end - start)
+
+    def solve(self):
+        """Returns a dict with the points of every component for the current angle, radius and center."""
+        angle = self.angle_func()
+        radius = self.radius_func()
+        center = np.array(self.center_func(), dtype=float)
+
+        key = (angle, radius, *center)
+        if key == self._key:
+            return self._points
+        self._key = key
+
+        points = self._points
+        right = center + (radius, 0, 0)
+        end = center + (np.cos(angle) * radius, np.sin(angle) * radius, 0)
+
+        points["circle"][:] = center + radius * self.unit_circle
+        self.line_points(center, right, points["fixed_segment"])
+        self.line_points(center, end, points["rotating_segment"])
+        points["dot"][:] = right + self.dot_template
+        points["center_dot"][:] = center + self.center_dot_template
+
+        # Same construction as Arc.generate_points
+        angles = np.linspace(0, angle, self.arc_components)
+        cos, sin = np.cos(angles), np.sin(angles)
+        anchors = np.stack([cos, sin, np.zeros_like(cos)], axis=1) * radius + center
+        tangents = np.stack([-sin, cos, np.zeros_like(cos)], axis=1) * radius * angle / (3 * (self.arc_components - 1))
+        arc = points["arc_arrow"].reshape(-1, 4, 3)
+        arc[:, 0] = anchors[:-1]
+        arc[:, 1] = anchors[:-1] + tangents[:-1]
+        arc[:, 2] = anchors[1:] - tangents[1:]
+        arc[:, 3] = anchors[1:]
+
+        if angle > 0.1:
+            points["tip"][:] = end + self.rotate_points(self.tip_template, angle + np.sign(angle) * PI / 2)
+        else:
+            # A collapsed tip, the same as an arc without one
+            points["tip"][:] = end
+
+        # A full turn keeps theta opposite the fixed segment rather than wrapping it back to 0
+        wrapped_angle = angle - TAU * np.floor(angle / TAU)
+        if wrapped_angle == 0 and angle > 0:
+            wrapped_angle = TAU
+        half_angle = wrapped_angle / 2
+        points["theta"][:] = center + self.theta_radius * np.array((np.cos(half_angle), np.sin(half_angle), 0))
+
+        return points
+
+    def apply(self, mobject, name):
+        """Writes the solved points of the component name into mobject."""
+        points = self.solve()
+
+        if name == "theta":
+            if self.angle_func() != 0:
+                mobject.move_to(points["theta"])
+            return mobject
+
+        self.write_points(mobject, points[name])
+
+        if name == "arc_arrow" and mobject.submobjects:
+            self.write_points(mobject.submobjects[0], points["tip"])
+
+        return mobject
+
+    @staticmethod
+    def write_points(mobject, points):
+        """Writes points into the existing point array of mobject, reallocating only if the size changed."""
+        if mobject.points.shape == points.shape:
+            mobject.points[:] = points
+        else:
+            mobject.set_points(points.copy())
+
 class RadianCircle():
     """An updating circle, labels and objects."""
     @classmethod
@@ -67,7 +1735,8 @@ class RadianCircle():
         radius_tracker: ValueTracker = None,
         simplified: bool = False,
         segment_color: str = ANIM_ORANGE,
-        circle_stroke_width: float = 3
+        circle_stroke_width: float = 3,
+        rig: bool = False
         ):
         """Returns a circle with extra objects.
         
@@ -95,6 +1764,9 @@ class RadianCircle():
             The color of the segments forming the angle.
         circle_stroke_width : float
             The stroke width of the circle.
+        rig : bool
+            If set to True, the circle, segments, dots, arc and theta share a single RadianCircleRig that computes
+            their points in one pass per frame and writes them in place, instead of rebuilding each one with become().
 
         Returns
         -----------
@@ -106,6 +1778,10 @@ class RadianCircle():
             return str(round(label_radius * tracker.get_value(), 1))
 
         def get_angle_label():
+            key = ("RadianCircle.angle_label", use_letters, label_radius, get_distance(), f"{tracker.get_value():.2f}")
+            return LabelCache.get(key, build_angle_label)
+
+        def build_angle_label():
             distance = float(get_distance())
 
             if use_letters and distance <= label_radius:
@@ -132,6 +1808,17 @@ class RadianCircle():
             return VGroup(tmp_frac[:2], text_distance, tmp_frac[3], text_rad).set_color(TEXT_COLOR)
 
         def get_distance_label():
+            if tracker.get_value() <= 0.5:
+                return VMobject()
+
+            key = ("RadianCircle.distance_label", use_letters, label_radius, get_distance(), f"{tracker.get_value():.2f}" if use_letters else None)
+            label = LabelCache.get(key, build_distance_label)
+            # Middle of Arc(radius=radius_func()+0.3, angle=tracker.get_value(), arc_center=center())
+            half_angle = tracker.get_value() / 2
+
+            return label.move_to(center() + (radius_func() + 0.3) * np.array([np.cos(half_angle), np.sin(half_angle), 0]))
+
+        def build_distance_label():
             label = None
             if use_letters:
                 if float(get_distance()) <= label_radius:
@@ -144,10 +1831,7 @@ class RadianCircle():
                 dist = float(get_distance())
                 label = DecimalNumber(dist, num_decimal_places=1)
 
-            label.scale(0.5).set_color(ANIM_ORANGE)
-            label.move_to(Arc(radius=radius_func()+0.3, angle=tracker.get_value(), arc_center=center()).point_from_proportion(0.5))
-
-            return label if tracker.get_value() > 0.5 else VMobject()
+            return label.scale(0.5).set_color(ANIM_ORANGE)
 
         center = lambda: coords
         if x_tracker is not None:
@@ -157,68 +1841,177 @@ class RadianCircle():
 
         initial_angle = tracker.get_value()
 
-        circle = Circle(radius=radius_func(), color=ANIM_BLACK, stroke_width=circle_stroke_width).move_to(center()).add_updater(
-            lambda m: m.become(Circle(radius=radius_func(), color=ANIM_BLACK, stroke_width=circle_stroke_width)).move_to(center())
-        )
+        # Every updater only runs on frames where one of these trackers changed
+        trackers = [t for t in (tracker, x_tracker, radius_tracker) if t is not None]
+        track = lambda updater: TrackedUpdater(updater, *trackers)
 
-        fixed_segment = Line(start=center(), end=circle.get_right(), color=segment_color).add_updater(
-            lambda m: m.become(Line(start=center(), end=circle.get_right(), color=segment_color))
-        )
+        circle = Circle(radius=radius_func(), color=ANIM_BLACK, stroke_width=circle_stroke_width).move_to(center())
 
-        rotating_segment = Line(
+        fixed_segment = ReconfigurableLine(start=center(), end=circle.get_right(), color=segment_color)
+
+        rotating_segment = ReconfigurableLine(
             start=center(),
             end=(center()[0] + np.cos(initial_angle)*radius_func(), center()[1] + np.sin(initial_angle)*radius_func(), 0),
-            color=segment_color).add_updater(
-            lambda m: m.become(
-                Line(
-                    start=center(),
-                    end=(center()[0] + np.cos(tracker.get_value())*radius_func(), center()[1] + np.sin(tracker.get_value())*radius_func(), 0),
-                    color=segment_color))
-        )
+            color=segment_color)
+
+        center_dot = Dot(circle.get_center(), radius=DEFAULT_DOT_RADIUS/2, color=segment_color)
+
+        if rig:
+            circle_rig = RadianCircleRig(tracker.get_value, radius_func, center)
+            for mob, name in [(circle, "circle"), (fixed_segment, "fixed_segment"), (rotating_segment, "rotating_segment"),
+                (center_dot, "center_dot")]:
+                mob.add_updater(track(lambda m, name=name: circle_rig.apply(m, name)))
+        else:
+            circle.add_updater(track(
+                lambda m: m.become(Circle(radius=radius_func(), color=ANIM_BLACK, stroke_width=circle_stroke_width)).move_to(center())
+            ))
+
+            fixed_segment.add_updater(track(lambda m: m.set_endpoints(center(), circle.get_right())))
+
+            rotating_segment.add_updater(track(
+                lambda m: m.set_endpoints(
+                    center(),
+                    (center()[0] + np.cos(tracker.get_value())*radius_func(), center()[1] + np.sin(tracker.get_value())*radius_func(), 0))
+            ))
 
-        center_dot = Dot(circle.get_center(), radius=DEFAULT_DOT_RADIUS/2, color=segment_color).add_updater(lambda m: m.move_to(center()))
+            center_dot.add_updater(track(lambda m: m.move_to(center())))
 
         if simplified:
             return VGroup(circle, fixed_segment, rotating_segment, center_dot)
 
         theta = MathTex(r"\theta", color=ANIM_ORANGE).scale(0.5).move_to(circle.get_right())
 
-        theta.add_updater(lambda m: m.move_to(
-            Angle(
-                fixed_segment, rotating_segment, radius=0.1 + 3 * SMALL_BUFF, other_angle=False
-            ).point_from_proportion(0.5)
-        )if tracker.get_value() != 0 else lambda m: m)
+        dot = Dot(circle.get_right(), color=ANIM_ORANGE)
 
-        theta.add_updater(lambda m: m.set_opacity(tracker.get_value()*2))
+        arc_arrow = ReconfigurableArc(radius=radius_func(), angle=tracker.get_value(), color=ANIM_ORANGE, arc_center=center())
 
-        dot = Dot(circle.get_right(), color=ANIM_ORANGE).add_updater(lambda m: m.move_to(circle.get_right()))
+        if rig:
+            # The tip is always present and collapsed to a point while the angle is too small to show it
+            arc_arrow.add_tip(tip_length=0.1)
+            for mob, name in [(theta, "theta"), (dot, "dot"), (arc_arrow, "arc_arrow")]:
+                mob.add_updater(track(lambda m, name=name: circle_rig.apply(m, name)), call_updater=True)
+        else:
+            theta.add_updater(track(lambda m: m.move_to(
+                Angle(
+                    fixed_segment, rotating_segment, radius=0.1 + 3 * SMALL_BUFF, other_angle=False
+                ).point_from_proportion(0.5)
+            )if tracker.get_value() != 0 else lambda m: m))
 
-        arc_arrow = Arc(radius=radius_func(), angle=tracker.get_value(), color=ANIM_ORANGE, arc_center=center()).add_updater(
-            lambda m: m.become(Arc(radius=radius_func(), angle=tracker.get_value(), color=ANIM_ORANGE, arc_center=center()).add_tip(tip_length=0.1)
-                if tracker.get_value() > 0.1 else Arc(radius=radius_func(), angle=tracker.get_value(), color=ANIM_ORANGE, arc_center=center()))
-        )
+            dot.add_updater(track(lambda m: m.move_to(circle.get_right())))
+
+            def update_arc_arrow(m):
+                m.set_arc(tracker.get_value(), radius_func(), center())
+                # The tip is only built or dropped when the angle crosses 0.1
+                if tracker.get_value() > 0.1 and not m.has_tip():
+                    m.add_tip(tip_length=0.1)
+                elif tracker.get_value() <= 0.1 and m.has_tip():
+                    m.pop_tips()
+
+            arc_arrow.add_updater(track(update_arc_arrow))
+
+        theta.add_updater(track(lambda m: m.set_opacity(tracker.get_value()*2)))
 
         label_radius_tex = MathTex("r \ = \ " + str(label_radius) if not use_letters else "r", color=ANIM_ORANGE).scale(0.43).add_updater(
-            lambda m, dt: m.next_to(fixed_segment, DOWN), call_updater=True
+            track(lambda m: m.next_to(fixed_segment, DOWN)), call_updater=True
         )
 
-        label_distance = get_distance_label().add_updater(lambda m: m.become(get_distance_label()))
+        label_distance = get_distance_label().add_updater(track(lambda m: m.become(get_distance_label())))
 
         group = VGroup(circle, fixed_segment, rotating_segment, theta, dot, center_dot, arc_arrow, label_radius_tex, label_distance)
 
         if not show_angle_label:
             return group
 
-        angle_label = get_angle_label().set_color(ANIM_BLACK).scale(0.6).next_to(circle, UP, buff=0.6).add_updater(lambda m: m.become(
+        angle_label = get_angle_label().set_color(ANIM_BLACK).scale(0.6).next_to(circle, UP, buff=0.6).add_updater(track(lambda m: m.become(
             get_angle_label().set_color(ANIM_BLACK).scale(0.6).next_to(circle, UP, buff=0.6)
-        ))
+        )))
 
         group.add(angle_label)        
 
         return group
 
+class RadianCircleField(VGroup):
+    """Many simplified RadianCircles whose geometry is kept in NumPy arrays and updated in one vectorized step.
+
+    Every circle is a VGroup(circle, fixed_segment, rotating_segment, center_dot), like the
+    simplified get_circle_and_objs, but instead of four updaters per circle a single updater on
+    the field reads each distinct tracker once and computes the points of every circle at once.
+    The field owns the geometry: to move circles while it is updating, change centers or radii
+    and call update_geometry.
+    """
+    def __init__(self, centers, radii=1, trackers=None, segment_colors=ANIM_ORANGE, circle_stroke_width=3, rows=1, **kwargs):
+        """
+        Parameters
+        -----------
+        centers : list
+            The center of every circle.
+        radii : float | list
+            The radius of every circle, or one radius for all of them.
+        trackers : ValueTracker | list
+            The ValueTracker of the angle of every circle, or one shared by all of them.
+        segment_colors : str | list
+            The color of the segments of every circle, or one color for all of them.
+        circle_stroke_width : float
+            The stroke width of the circles.
+        rows : int
+            The number of VGroups the circles are split in, in order.
+        """
+        super().__init__(**kwargs)
+        self.centers = np.array(centers, dtype=float).reshape(-1, 3)
+        count = len(self.centers)
+        self.radii = np.broadcast_to(np.asarray(radii, dtype=float), (count,)).copy()
+
+        if not isinstance(trackers, (list, tuple)):
+            trackers = [ValueTracker(0) if trackers is None else trackers] * count
+        self.trackers = list(dict.fromkeys(trackers))
+        self.tracker_indices = np.array([self.trackers.index(tracker) for tracker in trackers])
+
+        self.segment_colors = segment_colors if isinstance(segment_colors, (list, tuple)) else [segment_colors] * count
+        self.circle_template = Circle(radius=1).points
+        self.dot_template = Dot(ORIGIN, radius=DEFAULT_DOT_RADIUS/2).points
+        # Line points are the ends and the two thirds in between
+        self.line_alphas = np.linspace(0, 1, 4)[None, :, None]
+
+        self.circles = [
+            VGroup(
+                Circle(radius=radius, color=ANIM_BLACK, stroke_width=circle_stroke_width).move_to(center),
+                Line(center, center + radius*RIGHT, color=color),
+                Line(center, center + radius*RIGHT, color=color),
+                Dot(center, radius=DEFAULT_DOT_RADIUS/2, color=color))
+            for center, radius, color in zip(self.centers, self.radii, self.segment_colors)]
+
+        per_row = -(-count // rows)
+        if rows == 1:
+            self.add(*self.circles)
+        else:
+            self.add(*[VGroup(*self.circles[i:i + per_row]) for i in range(0, count, per_row)])
+
+        self.add_updater(TrackedUpdater(lambda m: m.update_geometry(), *self.trackers), call_updater=True)
+
+    def update_geometry(self):
+        """Writes the points of every circle from the centers, radii and tracker values."""
+        angles = np.array([tracker.get_value() for tracker in self.trackers])[self.tracker_indices]
+        centers = self.centers[:, None, :]
+        radii = self.radii[:, None]
+
+        fixed_ends = self.centers + radii * RIGHT
+        rotating_ends = self.centers + radii * np.stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=1)
+
+        circle_points = centers + radii[:, :, None] * self.circle_template
+        fixed_points = centers + self.line_alphas * (fixed_ends - self.centers)[:, None, :]
+        rotating_points = centers + self.line_alphas * (rotating_ends - self.centers)[:, None, :]
+        dot_points = centers + self.dot_template
+
+        for (circle, fixed_segment, rotating_segment, center_dot), *points in zip(
+                self.circles, circle_points, fixed_points, rotating_points, dot_points):
+            circle.points, fixed_segment.points, rotating_segment.points, center_dot.points = points
+
+        return self
+
 class Compass():
     """A compass with two perpendicular double arrows and labels."""
+    template = None
+
     @classmethod
     def create_compass(self, labels=None, coords=ORIGIN, rotation=0):
         """Returns a compass.
@@ -259,8 +2052,91 @@ class Compass():
 
         return compass
 
+    @classmethod
+    def get_template(self):
+        """Returns the points and style of the strokes and of the tips of an unlabeled compass at the origin.
+
+        The template is computed once, every compass instance starts from a copy of its points.
+        """
+        if self.template is None:
+            lines, tips = [], []
+            for arrow in self.create_compass():
+                arrow_tips = arrow.get_tips()
+                lines.append(arrow.points)
+                tips.extend(tip.points for tip in arrow_tips)
+            self.template = (np.concatenate(lines), arrow.get_style(), np.concatenate(tips), arrow_tips[0].get_style())
+
+        return self.template
+
+    @classmethod
+    def create_instance(self, coords=ORIGIN, rotation=0):
+        """Returns an unlabeled compass built from the template, looking like create_compass(coords=coords, rotation=rotation).
+
+        The strokes and the tips of both arrows are a single VMobject each, instead of two
+        DoubleArrows made of a line and two tips.
+
+        Parameters
+        -----------
+        coords : np.array
+            The position of the compass.
+        rotation : float
+            The angle to rotate the compass.
+
+        Returns
+        -----------
+        VGroup
+            A group of the strokes and the tips.
+        """
+        line_points, line_style, tip_points, tip_style = self.get_template()
+        lines = VMobject(z_index=-10).set_points(line_points.copy()).set_style(**line_style)
+        tips = VMobject(z_index=-10).set_points(tip_points.copy()).set_style(**tip_style)
+
+        return VGroup(lines, tips).move_to(coords).rotate(rotation)
+
+class CompassInstances():
+    """A fixed number of compass instances, each created the first time it is indexed."""
+    def __init__(self, count, coords=ORIGIN, rotation=0):
+        """
+        Parameters
+        -----------
+        count : int
+            The number of compasses.
+        coords : np.array
+            The position of the compasses.
+        rotation : float
+            The initial angle of the compasses.
+        """
+        self.count = count
+        self.coords = coords
+        self.rotation = rotation
+        self.instances = {}
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("compass index out of range")
+        if index not in self.instances:
+            self.instances[index] = Compass.create_instance(self.coords, self.rotation)
+
+        return self.instances[index]
+
+    @property
+    def created(self):
+        """The compasses created so far."""
+        return list(self.instances.values())
+
 class Timer():
-    """A timer with animating functionality."""
+    """A timer with animating functionality.
+
+    Every digit is laid out once when the timer is created and only the one matching the elapsed
+    time is visible, so counting down never copies points. The elapsed time is derived from the
+    animation itself, which lets several timers run at once in the same scene."""
     @classmethod
     def create_timer(self, seconds=5):
         """Creates the timer.
@@ -275,47 +2151,244 @@ class Timer():
         VGroup
             A group containing the circle and numbers.
         """
-        numbers = [Text(str(i), color=TEXT_COLOR, font="Segoe UI Light").scale(0.4) for i in range(seconds+1)]
+        numbers = [GlyphStore.text(str(i), color=TEXT_COLOR, font="Segoe UI Light").scale(0.4) for i in range(seconds+1)]
         numbers.reverse()
         circle = Circle(radius=max(numbers[0].height, numbers[0].width)*1.5, color=ANIM_ORANGE, stroke_width=2).to_corner(DL).rotate(PI/2)
         for i in numbers:
             i.move_to(circle.get_center())
+        for i in numbers[1:]:
+            i.set_opacity(0)
 
         return VGroup(VGroup(*numbers), circle)
 
     @classmethod
-    def animate(self, renderer, timer):
-        """Animates the timer counting down. The timer should already be on screen before
-        calling this method.
+    def countdown(self, timer):
+        """Creates the animation of the timer counting down. Countdowns of several timers can be
+        played together.
 
         Parameters
         -----------
-        renderer : Scene
-            The Scene where the timer will be animated.
         timer : Timer
             The timer to be animated.
 
         Returns
         -----------
-        None
+        AnimationGroup
+            The countdown, lasting as many seconds as the timer was created with.
         """
-        global time_passed
-        time_passed = 0
         numbers = timer[0]
         circle = timer[1]
+        seconds = len(numbers) - 1
+
+        def show_number(mob, alpha):
+            index = min(int(alpha * seconds), seconds)
+            for i, number in enumerate(mob):
+                opacity = 1 if i == index else 0
+                if number.get_fill_opacity() != opacity:
+                    number.set_opacity(opacity)
+
+        return AnimationGroup(
+            Uncreate(circle, rate_func=lambda t: 1-t),
+            UpdateFromAlphaFunc(numbers, show_number, rate_func=linear),
+            run_time=seconds
+        )
+
+    @classmethod
+    def animate(self, renderer, *timers):
+        """Animates the timers counting down. The timers should already be on screen before
+        calling this method.
+
+        Parameters
+        -----------
+        renderer : Scene
+            The Scene where the timers will be animated.
+        *timers : Timer
+            The timers to be animated.
+
+        Returns
+        -----------
+        None
+        """
+        renderer.play(*[self.countdown(timer) for timer in timers])
+        renderer.play(*[FadeOut(timer[0]) for timer in timers], run_time=0.5)
+
+class DashRing(VGroup):
+    """A ring of 360 dashes, one per degree, drawn as one VMobject per dash style.
+
+    The dashes are computed in a single NumPy pass and every style (thin, middle and thick)
+    is a single VMobject holding one subpath per dash. Hidden dashes are shrunk about their
+    centers to a negligible length instead of being removed, so the ring keeps its point
+    layout and can still be moved or transformed as a whole.
+    """
+    thick_angles = [0, 90, 180, 270]
+    middle_step = 10
+    hidden_scale = 1e-6
+
+    def __init__(self, center=ORIGIN, radius=1, offset1=0.05, offset2=0.06, color=ANIM_BLACK, z_index=-10, **kwargs):
+        """
+        Parameters
+        -----------
+        center : np.array
+            The center of the ring.
+        radius : float
+            The radius of the circle the ring is drawn on.
+        offset1 : float
+            The distance from the circle to the center of the thin dashes.
+        offset2 : float
+            The extra distance to the center of the thick dashes, half of it for the middle ones.
+        color : str
+            The color of the dashes.
+        z_index : float
+            The z_index of the dashes.
+        """
+        super().__init__(**kwargs)
+
+        angles = np.arange(360)
+        thick = np.isin(angles, self.thick_angles)
+        middle = angles % self.middle_step == 0
+
+        r = radius - offset1 - np.select([thick, middle], [offset2, offset2 / 2], 0)
+        length = 0.07 + np.maximum(0.18 * thick, 0.1 * middle)
+
+        a = angles * DEGREES
+        direction = np.stack([np.cos(a), np.sin(a), np.zeros_like(a)], axis=1)
+        centers = np.array(center, dtype=float) + direction * r[:, None]
+        # Same points as a straight Line from start to end
+        proportions = np.linspace(-0.5, 0.5, 4)
+        points = centers[:, None] + direction[:, None] * (length[:, None, None] * proportions[None, :, None])
+
+        self.styles = np.select([thick, middle], [2, 1], 0)
+        self.dash_scales = np.ones(len(angles))
+
+        for style, stroke_width in enumerate([1, 1.5, 2.5]):
+            batch = VMobject(stroke_width=stroke_width, color=color, z_index=z_index)
+            batch.set_points(points[self.styles == style].reshape(-1, 3))
+            self.add(batch)
+
+        # The position of every dash inside its batch
+        self.slots = np.zeros(len(angles), dtype=int)
+        for style in range(3):
+            self.slots[self.styles == style] = np.arange(np.count_nonzero(self.styles == style))
+
+    def get_dash_points(self, index):
+        """Returns the four points of the dash at index (the angle in degrees)."""
+        slot = self.slots[index]
+        return self.submobjects[self.styles[index]].points[4 * slot:4 * slot + 4]
+
+    def get_dash(self, index):
+        """Returns a new Line with the geometry and style of the dash at index, for animations."""
+        batch = self.submobjects[self.styles[index]]
+        points = self.get_dash_points(index)
+        center = points.mean(axis=0)
+        points = center + (points - center) / self.dash_scales[index]
+
+        return Line(points[0], points[-1], color=batch.get_stroke_color(), stroke_width=batch.get_stroke_width(), z_index=batch.z_index)
+
+    def set_visible(self, mask):
+        """Shows the dashes where mask is True and hides the rest.
+
+        Parameters
+        -----------
+        mask : np.array
+            An array of 360 booleans, one per dash.
+
+        Returns
+        -----------
+        DashRing
+            The ring itself.
+        """
+        scales = np.where(np.asarray(mask, dtype=bool), 1.0, self.hidden_scale)
+        changed = scales != self.dash_scales
+
+        for style, batch in enumerate(self.submobjects):
+            indices = np.flatnonzero(changed & (self.styles == style))
+            if indices.size == 0:
+                continue
+            dashes = batch.points.reshape(-1, 4, 3)
+            slots = self.slots[indices]
+            centers = dashes[slots].mean(axis=1, keepdims=True)
+            factors = (scales[indices] / self.dash_scales[indices])[:, None, None]
+            dashes[slots] = centers + (dashes[slots] - centers) * factors
+
+        self.dash_scales = scales
+
+        return self
+
+    def show(self, indices):
+        """Shows the dashes at indices, keeping the visibility of the rest."""
+        mask = self.dash_scales == 1
+        mask[np.asarray(indices, dtype=int)] = True
+        return self.set_visible(mask)
+
+    def hide(self, indices):
+        """Hides the dashes at indices, keeping the visibility of the rest."""
+        mask = self.dash_scales == 1
+        mask[np.asarray(indices, dtype=int)] = False
+        return self.set_visible(mask)
+
+class ProgressiveReveal(VMobject):
+    """Reveals the dashes of a DashRing and a set of labels as a ValueTracker sweeps over their angles.
+
+    Every dash and label is on screen from the start. Each frame only the degrees swept since
+    the previous frame are marked in the visibility mask, in either direction and wrapping
+    around 360, and revealed labels fade in.
+    """
+    def __init__(self, tracker, dashes, labels=None, label_angles=(0, 90, 180, 270), fade_rate=2, **kwargs):
+        """
+        Parameters
+        -----------
+        tracker : ValueTracker
+            The ValueTracker with the current angle in degrees.
+        dashes : DashRing
+            The dashes to reveal.
+        labels : VGroup
+            The labels to reveal.
+        label_angles : list
+            The angle in degrees of each label.
+        fade_rate : float
+            The opacity a revealed label gains per second.
+        """
+        super().__init__(**kwargs)
+        self.tracker = tracker
+        self.dashes = dashes
+        self.labels = labels if labels is not None else VGroup()
+        self.label_angles = np.array(label_angles[:len(self.labels)]) % 360
+        self.fade_rate = fade_rate
 
-        def get_number(dt):
-            global time_passed
-            index = min(int(time_passed), len(numbers) - 1)
-            time_passed += dt
+        self.revealed = np.zeros(len(dashes.dash_scales), dtype=bool)
+        self.label_revealed = np.zeros(len(self.labels), dtype=bool)
+        self.label_opacities = np.zeros(len(self.labels))
+        self.last_angle = tracker.get_value()
 
-            return numbers[index]
+        dashes.set_visible(self.revealed)
+        self.labels.set_opacity(0)
 
-        numbers[0].add_updater(lambda m, dt: m.become(get_number(dt)))
-        renderer.play(Uncreate(circle, rate_func=lambda t: 1-t), run_time=5)
-        numbers[0].clear_updaters()
-        numbers[0].become(numbers[-1])
-        renderer.play(FadeOut(numbers[0]), run_time=0.5)
+        self.add_updater(lambda m, dt: m.reveal(dt))
+
+    def reveal(self, dt):
+        """Reveals the dashes and labels swept since the last frame and fades in the revealed labels."""
+        if dt == 0:
+            return self
+
+        n = len(self.revealed)
+        angle = self.tracker.get_value()
+        low, high = sorted((int(np.floor(self.last_angle)), int(np.floor(angle))))
+        self.last_angle = angle
+
+        swept = np.arange(low, min(high, low + n - 1) + 1) % n
+        new = swept[~self.revealed[swept]]
+        if new.size:
+            self.revealed[new] = True
+            self.dashes.show(new)
+
+        fading = np.flatnonzero(self.label_revealed & (self.label_opacities < 1))
+        for i in fading:
+            self.label_opacities[i] = min(1, self.label_opacities[i] + dt * self.fade_rate)
+            self.labels[i].set_opacity(self.label_opacities[i])
+
+        self.label_revealed |= np.isin(self.label_angles, swept)
+
+        return self
 
 class TicksAndLabelsFromCircle():
     """A set of ticks/dashes and labels constructed around a circle."""
@@ -350,26 +2423,30 @@ class TicksAndLabelsFromCircle():
         inner_labels_tex = VGroup()
         outer_labels_tex = VGroup()
 
-        for i, (a, inner, outer) in enumerate(zip(label_angles, inner_labels, outer_labels)):
+        label_angles = list(label_angles)
+        n = min(len(label_angles), len(inner_labels), len(outer_labels))
+
+        # Every label is compiled in a single LaTeX run
+        labels_tex = TexCache.math_tex_batch(
+            [(i,) for i in [*inner_labels[:n], *outer_labels[:n], *full_turn_labels]],
+            tex_template=segoe_template, color=TEXT_COLOR)
+        labels_tex = [i.scale(scale_factor) for i in labels_tex]
+
+        for i, (a, inner_label, outer_label) in enumerate(zip(label_angles, labels_tex[:n], labels_tex[n:2*n])):
             tick = Line(stroke_width=2, color=ANIM_BLACK)
             tick.set_length(0.15).rotate(a)
             tick.move_to((p[0] + np.cos(a) * r, p[1] + np.sin(a) * r, 0))
             ticks.add(tick)
 
-            inner_label = MathTex(inner, tex_template=segoe_template, color=TEXT_COLOR).scale(scale_factor)
             direction = DOWN*round(np.sin(a), 10)+LEFT*round(np.cos(a), 10)
             inner_label.next_to(tick.get_start(), direction, aligned_edge=direction, buff=0.23)
             inner_labels_tex.add(inner_label)
 
-            outer_label = MathTex(outer, tex_template=segoe_template, color=TEXT_COLOR).scale(scale_factor)
             direction = UP*round(np.sin(a), 10)+RIGHT*round(np.cos(a), 10)
             outer_label.next_to(tick, direction, aligned_edge=ORIGIN, buff=0.1)
             outer_labels_tex.add(outer_label)
         
-        inner_full_turn, outer_full_turn = [
-            MathTex(i, tex_template=segoe_template, color=TEXT_COLOR).scale(scale_factor)
-            for i in full_turn_labels
-            ]
+        inner_full_turn, outer_full_turn = labels_tex[2*n:]
 
         inner_full_turn.next_to(inner_labels_tex[0], DOWN, buff=0.1).align_to(inner_labels_tex[0], RIGHT)
         outer_full_turn.next_to(outer_labels_tex[0], DOWN, buff=0.1).align_to(outer_labels_tex[0], LEFT)
@@ -382,7 +2459,122 @@ class TicksAndLabelsFromCircle():
 
         return (ticks, inner_labels_tex, outer_labels_tex)
 
-class GridCompass(Scene):
+def install_patches():
+    """Installs the manim patches of this module: BackgroundRaster, AlignPoints, PlayHash and TrackedUpdater.
+
+    Importing this module patches nothing. Scenes of this module opt in through PatchedScene,
+    other code calls this before rendering. UpdaterProfiler is installed as well when the
+    PROFILE_UPDATERS environment variable is set.
+    """
+    BackgroundRaster.install()
+    AlignPoints.install()
+    PlayHash.install()
+    TrackedUpdater.install()
+    if os.environ.get("PROFILE_UPDATERS"):
+        UpdaterProfiler.install()
+
+class PatchedScene():
+    """A Scene mixin calling install_patches before the scene renders, listed before the Scene base."""
+
+    def render(self, *args, **kwargs):
+        install_patches()
+        # Looked up after installing, so the patches wrapping Scene.render apply to this render
+        return super().render(*args, **kwargs)
+
+class TimelineScene(PatchedScene, Scene):
+    """A Scene played from a declarative timeline instead of a construct method.
+
+    The timeline is a dict with:
+        "cast": the mobjects and ValueTrackers of the scene, as a dict of names to functions
+            building each one from the dict of those built before it.
+        "segments": a list of dicts with a "name" and a list of "steps". A step is one of
+            ("add", *names), ("remove", *names), ("wait", seconds) or ("play", animations, kwargs),
+            every animation being (AnimationClass, names, kwargs) or ("animate", name, method, *args).
+    Names can index submobjects with dots, e.g. "circle.0". Optional kwargs can be left out.
+
+    Each segment is hashed from its steps, the cast and the hash of the segment before it, so
+    render_timeline only renders again the segment that changed and the ones after it.
+    """
+    timeline = {"cast": {}, "segments": []}
+    version = 1
+    # A base for timeline scenes, see get_scene_classes
+    renderable = False
+
+    def construct(self):
+        self.cast = {}
+        for name, build in self.timeline["cast"].items():
+            self.cast[name] = build(self.cast)
+
+        for segment in self.timeline["segments"]:
+            for step in segment["steps"]:
+                self.run_step(*step)
+
+    def get_mobject(self, name):
+        """Returns the mobject of the cast with the given name, indexed by its dotted suffix."""
+        name, *indices = name.split(".")
+        mobject = self.cast[name]
+        for i in indices:
+            mobject = mobject[int(i)]
+
+        return mobject
+
+    def get_animation(self, spec):
+        """Returns the animation described by a timeline step."""
+        if spec[0] == "animate":
+            _, name, method, *args = spec
+            return getattr(self.get_mobject(name).animate, method)(*args)
+
+        animation_class, names, *kwargs = spec
+        names = [names] if isinstance(names, str) else names
+
+        return animation_class(*[self.get_mobject(name) for name in names], **(kwargs[0] if kwargs else {}))
+
+    def run_step(self, kind, *args):
+        """Runs a single timeline step."""
+        if kind == "add":
+            self.add(*[self.get_mobject(name) for name in args])
+        elif kind == "remove":
+            self.remove(*[self.get_mobject(name) for name in args])
+        elif kind == "wait":
+            self.wait(*args)
+        elif kind == "play":
+            animations, *kwargs = args
+            self.play(*[self.get_animation(spec) for spec in animations], **(kwargs[0] if kwargs else {}))
+        else:
+            raise ValueError(f"Unknown timeline step {kind!r}")
+
+    @classmethod
+    def get_segments(self, quality):
+        """Returns the name, the range of plays [start, end) and the hash of every segment.
+
+        Parameters
+        -----------
+        quality : str
+            The quality the segments are rendered at, which is part of their hash.
+
+        Returns
+        -----------
+        list
+            A list of (name, start, end, hash) tuples.
+        """
+        segments = []
+        # The steps call helpers and read constants of the module, which their identities do not cover
+        previous = get_stable_identity([self.version, quality, get_source_hash(self.__module__), self.timeline["cast"]])
+        start = 0
+        for segment in self.timeline["segments"]:
+            plays = sum(step[0] in ("play", "wait") for step in segment["steps"])
+            if not plays:
+                raise ValueError(f"Timeline segment {segment['name']!r} has nothing to render")
+
+            hasher = hashlib.blake2b(digest_size=16)
+            hasher.update((previous + get_stable_identity(segment)).encode())
+            previous = hasher.hexdigest()
+            segments.append((segment["name"], start, start + plays, previous))
+            start += plays
+
+        return segments
+
+class GridCompass(PatchedScene, Scene):
     def construct(self):
         buff = 1.7
 
@@ -444,7 +2636,7 @@ class GridCompass(Scene):
         self.play(FadeOut(grid_objs, compass1, vectors))
         self.wait(0.5)
 
-class BigGridCompasses(Scene):
+class BigGridCompasses(PatchedScene, Scene):
     def construct(self):
         buff = 0.5
 
@@ -466,7 +2658,7 @@ class BigGridCompasses(Scene):
         compass1 = Compass.create_compass(labels=["N", "S", "W", "E"], coords=RIGHT*4)
         compass2 = Compass.create_compass(labels=["NE", "SW", "NW", "SE"], coords=compass1[0])
 
-        compasses = [Compass.create_compass(coords=compass1[0]) for _ in range(100)]
+        compasses = CompassInstances(100, coords=compass1[0])
 
         vector = Arrow(start=red_dot.get_center(), end=(buff*5.5, buff*4.5, 0), tip_length=.2, color=ANIM_ORANGE,
             z_index=100, buff=0).shift(shift_factor)
@@ -478,19 +2670,18 @@ class BigGridCompasses(Scene):
 
         radius = 0.925
 
-        circle = Circle(radius=compasses[-1].width/2, color=ANIM_BLACK, fill_opacity=1, z_index=-1).move_to(RIGHT*4)
+        circle = Circle(radius=compass1[0].width/2, color=ANIM_BLACK, fill_opacity=1, z_index=-1).move_to(RIGHT*4)
         outer_circle = Circle(radius=radius, color=ANIM_BLACK, z_index=-1).move_to(RIGHT*4)
 
         tracker = ValueTracker(PI/4)
 
         radius += 0.025
 
-        vec = Arrow(start=RIGHT*4, end=(4 + np.cos(tracker.get_value())*radius, np.sin(tracker.get_value())*radius, 0), color=ANIM_ORANGE, buff=0, z_index=1000,
+        vec = ReconfigurableArrow(start=RIGHT*4, end=(4 + np.cos(tracker.get_value())*radius, np.sin(tracker.get_value())*radius, 0), color=ANIM_ORANGE, buff=0, z_index=1000,
             stroke_width=6, tip_length=0.2, max_stroke_width_to_length_ratio=6)
 
-        vec.add_updater(lambda m: m.become(
-            Arrow(start=outer_circle.get_center(), end=(outer_circle.get_x() + np.cos(tracker.get_value())*radius, np.sin(tracker.get_value())*radius, 0),
-                color=ANIM_ORANGE, buff=0, z_index=1000, stroke_width=6, tip_length=0.2, max_stroke_width_to_length_ratio=6)))
+        vec.add_updater(lambda m: m.set_endpoints(
+            outer_circle.get_center(), (outer_circle.get_x() + np.cos(tracker.get_value())*radius, np.sin(tracker.get_value())*radius, 0)))
 
         vec.suspend_updating()
 
@@ -572,7 +2763,7 @@ class BigGridCompasses(Scene):
 
         self.wait(0.2)
         self.play(FadeOut(compass1[1], compass2[1]), FadeIn(circle))
-        self.remove(*compasses, compass1[0], compass2[0])
+        self.remove(*compasses.created, compass1[0], compass2[0])
         self.play(TransformMatchingShapes(circle, outer_circle))
         self.wait(0.5)
         vec.resume_updating()
@@ -602,7 +2793,9 @@ class BigGridCompasses(Scene):
         self.play(FadeOut(vec))
         self.wait(0.5)
 
-class DashedCircles(ZoomedScene):
+class DashedCircles(PatchedScene, ZoomedScene):
+    align_threshold = 350
+
     def __init__(self, **kwargs):
             ZoomedScene.__init__(
                 self,
@@ -617,25 +2810,6 @@ class DashedCircles(ZoomedScene):
             )
 
     def construct(self):
-        config.disable_caching = True
-        def show_dashes_and_labels(angle, dt):
-            if dt == 0:
-                return
-            angle_int = int(angle)
-            angles_to_show = [i % 360 for i in range(self.last_dashed_angle + 1, angle_int + 1)]
-            label_to_show = np.intersect1d(angles_to_show, angles_w_labels)
-            if label_to_show.size > 0:
-                label_to_show = angles_w_labels.index(label_to_show[0])
-                labels[label_to_show].add_updater(lambda m, dt: m.set_opacity(m.get_fill_opacity() + dt *2))
-                labels[label_to_show].set_opacity(0)
-                self.add(labels[label_to_show])
-                
-            self.last_dashed_angle = angle_int
-            
-            if angles_to_show:
-                for i in angles_to_show:
-                    self.add(dashes[i])
-
         zoomed_camera = self.zoomed_camera
         zoomed_display = self.zoomed_display
         frame = zoomed_camera.frame
@@ -645,13 +2819,12 @@ class DashedCircles(ZoomedScene):
         angle_tracker = ValueTracker(40)
 
         end_radius = 2.4
-        
-        self.last_dashed_angle = int(angle_tracker.get_value()) - 1
+
         angles_w_labels = [0, 90, 180, 270]
 
-        circle = Circle(radius=radius_tracker.get_value(), color=ANIM_BLACK).add_updater(
-            lambda m: m.become(Circle(radius=radius_tracker.get_value(), color=ANIM_BLACK))
-        )
+        circle = Circle(radius=radius_tracker.get_value(), color=ANIM_BLACK).add_updater(TrackedUpdater(
+            lambda m: m.become(Circle(radius=radius_tracker.get_value(), color=ANIM_BLACK)), radius_tracker
+        ))
 
         tmp_circ = Circle(radius=1.5)
 
@@ -671,7 +2844,7 @@ class DashedCircles(ZoomedScene):
 
         unfold_camera = UpdateFromFunc(zd_rect, lambda rect: rect.replace(zoomed_display))
 
-        dasher = VMobject().add_updater(lambda m, dt: show_dashes_and_labels(angle_tracker.get_value(), dt), call_updater=True)
+        dasher = ProgressiveReveal(angle_tracker, dashes, labels, angles_w_labels)
         dasher.suspend_updating()
 
         circle_r = Circle(radius=1.5, color=ANIM_BLACK).shift(RIGHT*4.5+DOWN*1.2)
@@ -696,7 +2869,7 @@ class DashedCircles(ZoomedScene):
         
         self.add(get_background())
 
-        self.add(circle, dasher)
+        self.add(circle, dashes, labels, dasher)
         self.wait(0.5)
         self.play(radius_tracker.animate.set_value(end_radius), run_time=2)
         vec = self.get_arrow(circle, angle_tracker=angle_tracker, radius_tracker=radius_tracker)
@@ -777,8 +2950,8 @@ class DashedCircles(ZoomedScene):
         tmp_label = labels.copy()
         tmp_ang_label = angle_label.copy()
 
-        tmp_ang_r = Text("11.11", font="Segoe UI Light", color=ANIM_ORANGE, stroke_width=1).scale(0.3).move_to(angle_label)
-        tmp_ang_l = Text("44.44", font="Segoe UI Light", color=ANIM_ORANGE, stroke_width=1).scale(0.3).move_to(angle_label)
+        tmp_ang_r = GlyphStore.text("11.11", font="Segoe UI Light", color=ANIM_ORANGE, stroke_width=1).scale(0.3).move_to(angle_label)
+        tmp_ang_l = GlyphStore.text("44.44", font="Segoe UI Light", color=ANIM_ORANGE, stroke_width=1).scale(0.3).move_to(angle_label)
         for i in [tmp_ang_l, tmp_ang_r, *objs_w_updaters]:
             i.resume_updating()
             i.update()
@@ -843,53 +3016,19 @@ class DashedCircles(ZoomedScene):
 
         a = angle_tracker.get_value
 
-        arrow = Arrow(
+        arrow = ReconfigurableArrow(
             start=p(),
             end=(p()[0] + np.cos(angle)*r(), p()[1] + np.sin(angle)*r(), 0),
             color=ANIM_ORANGE,
             tip_length=0.2,
             buff=0)
 
-        arrow.add_updater(lambda m: m.become(
-            Arrow(
-            start=p(),
-            end=(p()[0] + np.cos(a()*DEGREES)*r(), p()[1] + np.sin(a()*DEGREES)*r(), 0),
-            color=ANIM_ORANGE,
-            tip_length=0.2,
-            buff=0))
-            )
+        arrow.add_updater(lambda m: m.set_endpoints(p(), (p()[0] + np.cos(a()*DEGREES)*r(), p()[1] + np.sin(a()*DEGREES)*r(), 0)))
 
         return arrow
 
     def get_dashes(self, circle, offset1=0.05, offset2=0.06):
-        p = circle.get_center()
-        r = circle.radius
-        r -= offset1
-        
-        dashes = VGroup()
-
-        thick_angles = [0, 90, 180, 270]
-        middle_angles = range(0, 360, 10)
-
-        for i in range(0, 360):
-            a = i * DEGREES
-            thick = int(i in thick_angles)
-            middle = int(i in middle_angles)
-
-            if thick:
-                r -= offset2
-            
-            elif middle:
-                r -= offset2 / 2
-
-            dash = Line(stroke_width=1 + max(thick*1.5, middle/2), color=ANIM_BLACK, z_index=-10)
-            dash.set_length(0.07 + max(0.18*thick, 0.1*middle)).rotate(a)
-            dash.move_to((p[0] + np.cos(a) * r, p[1] + np.sin(a) * r, 0))
-            dashes.add(dash)
-
-            r = circle.radius - offset1
-
-        return dashes
+        return DashRing(circle.get_center(), circle.radius, offset1, offset2)
 
     def get_labels(self, circle, labels=["0°, 360°", "90°", "180°", "270°"]):
         labels_text = VGroup()
@@ -897,7 +3036,7 @@ class DashedCircles(ZoomedScene):
         for n, (i, d) in enumerate(zip(labels, dirs)):
             negative_buff = len(labels) != 4 and n % 2 != 0
             labels_text.add(
-                Text(i, font="Segoe UI Light", color=TEXT_COLOR, stroke_width=1).scale(0.34).next_to(circle.get_edge_center(d), d, buff=-0.35 if negative_buff else 0.22)
+                GlyphStore.text(i, font="Segoe UI Light", color=TEXT_COLOR, stroke_width=1).scale(0.34).next_to(circle.get_edge_center(d), d, buff=-0.35 if negative_buff else 0.22)
                 )
 
         return labels_text
@@ -913,7 +3052,8 @@ class DashedCircles(ZoomedScene):
         if is_degree:
             string += "°"
         pos = arrow.copy().scale(scaling).get_end()
-        label = Text(string, font="Segoe UI Light", color=ANIM_ORANGE, stroke_width=1).scale(0.32)
+        label = LabelCache.get(("DashedCircles.angle_label", string), lambda: GlyphStore.text(
+            string, font="Segoe UI Light", color=ANIM_ORANGE, stroke_width=1).scale(0.32))
         if decimal_places == 2 and int(custom_angle) == 40:
                 self.pos = pos + LEFT * label[:3].width
 
@@ -922,25 +3062,32 @@ class DashedCircles(ZoomedScene):
         
         return label.move_to(pos)
 
-class RadianWarning(Scene):
-    def construct(self):
+class RadianWarning(TimelineScene):
+    timeline = {
+        "cast": {
+            "background": lambda cast: get_background(),
+            "group": lambda cast: VGroup(
+                GlyphStore.text("Warning:", font="Segoe UI Light", color="#FF0000").scale(0.4),
+                GlyphStore.text("Radians Are Counter-Intuitive", font="Segoe UI Light", color="#FF0000").scale(0.4)
+                ).arrange(DOWN, buff=0.1).center(),
+            },
+        "segments": [
+            {"name": "warning", "steps": [
+                ("add", "background"),
+                ("play", [(GrowFromCenter, "group")]),
+                ("wait", 0.5),
+                ]},
+            {"name": "blink", "steps": [
+                ("play", [(FadeOut, "group")]),
+                ("play", [(FadeIn, "group")]),
+                ("play", [(FadeOut, "group")]),
+                ]},
+            ],
+        }
+
+class RadianExplanation101(PatchedScene, Scene):
+    align_threshold = 350
 
-        scale_factor = 0.4
-        warning = Text("Warning:", font="Segoe UI Light", color="#FF0000").scale(scale_factor)
-        rads = Text("Radians Are Counter-Intuitive", font="Segoe UI Light", color="#FF0000").scale(scale_factor)
-
-        group = VGroup(warning, rads).arrange(DOWN, buff=0.1).center()
-        
-        self.add(get_background())
-        self.play(GrowFromCenter(group))
-        self.wait(0.5)
-        self.play(FadeOut(group))
-        self.play(FadeIn(group))
-        self.play(FadeOut(group))
-        #self.play(ShrinkToCenter(group))
-        #self.wait(2)
-
-class RadianExplanation101(Scene):
     def construct(self):
         
         angle_tracker_1 = ValueTracker(0)
@@ -951,9 +3098,10 @@ class RadianExplanation101(Scene):
 
         rad_tracker = ValueTracker(1)
 
-        circle_1 = RadianCircle.get_circle_and_objs(1, 5, False, ORIGIN, angle_tracker_1, False, x_tracker)
+        circle_1 = RadianCircle.get_circle_and_objs(1, 5, False, ORIGIN, angle_tracker_1, False, x_tracker, rig=True)
 
-        circle_2 = RadianCircle.get_circle_and_objs(1, 10, False, RIGHT*1.5, angle_tracker_2, False, x_tracker_2, radius_tracker=rad_tracker)
+        circle_2 = RadianCircle.get_circle_and_objs(1, 10, False, RIGHT*1.5, angle_tracker_2, False, x_tracker_2, radius_tracker=rad_tracker,
+            rig=True)
 
         circles = VGroup(circle_1, circle_2)
 
@@ -976,17 +3124,10 @@ class RadianExplanation101(Scene):
 
         circle, fixed_segment, rotating_segment, theta, dot, center_dot, arc_arrow, label_radius_tex, label_distance = circle_1
 
-        circle.suspend_updating()
-
         self.play(FadeIn(circle))
-        circle.resume_updating()
         self.wait(0.5)
 
-        dot.suspend_updating()
-        arc_arrow.suspend_updating()
-
         self.play(FadeIn(dot, arc_arrow), run_time=0.7)
-        arc_arrow.resume_updating()
         self.play(angle_tracker_1.animate.set_value(1), run_time=4)
         self.wait(0.5)
 
@@ -994,14 +3135,9 @@ class RadianExplanation101(Scene):
             i.update()
             i.set_opacity(0)
             self.add(i)
-            i.suspend_updating()
-        circle_2[0].suspend_updating()
 
         self.play(VGroup(center_dot, fixed_segment, theta, rotating_segment).animate.set_opacity(1))
 
-        for i in circle_1[:-2]:
-            i.resume_updating()
-
         self.wait(0.5)
         self.play(x_tracker.animate.set_value(-2), FadeIn(circle_2[0]))
         self.wait(0.5)
@@ -1012,47 +3148,26 @@ class RadianExplanation101(Scene):
             i.update()
             i.set_opacity(0)
             self.add(i)
-            i.suspend_updating()
 
         self.play(VGroup(label_radius_tex, label_distance, *circle_2[1:6], *circle_2[7:]).animate.set_opacity(1),
             circle_2[6].animate.set_stroke(opacity=1))
 
-        for i in [label_distance, label_radius_tex, *circle_2[1:]]:
-            i.resume_updating()
-
         self.wait()
         self.play(angle_tracker_1.animate.set_value(4), angle_tracker_2.animate.set_value(2), run_time=2.5)
         self.wait()
         self.play(angle_tracker_1.animate.set_value(1), angle_tracker_2.animate.set_value(1), run_time=1.5)
-        # This is to increase render speed
-        circles.update()
-        circles.suspend_updating()
         self.wait()
-        rad_title = Text('1 radian', font='Segoe UI Light').scale(0.8).shift(3 * DOWN).set_color(TEXT_COLOR)
+        rad_title = GlyphStore.text('1 radian', font='Segoe UI Light').scale(0.8).shift(3 * DOWN).set_color(TEXT_COLOR)
         self.play(FadeIn(rad_title))
         self.wait(2)
 
         for i in range(2, 4):
-            # This is to increase render speed
-            circles.resume_updating()
-
             self.play(angle_tracker_1.animate.set_value(i), angle_tracker_2.animate.set_value(i), FadeOut(rad_title))
-            rad_title = Text(str(i) + ' radians', font='Segoe UI Light').scale(0.8).shift(3 * DOWN).set_color(TEXT_COLOR)
-            
-            # This is to increase render speed
-            circles.update()
-            circles.suspend_updating()
+            rad_title = GlyphStore.text(str(i) + ' radians', font='Segoe UI Light').scale(0.8).shift(3 * DOWN).set_color(TEXT_COLOR)
 
             self.play(FadeIn(rad_title))
             self.wait(2)
 
-        # This is to increase render speed
-        circles.resume_updating()
-
-        circles.update()
-        label_distance.suspend_updating()
-        circle_2[-1].suspend_updating()
-
         self.play(
             VGroup(label_distance, circle_2[-1]).animate(run_time=0.5).set_opacity(0),
             angle_tracker_1.animate.set_value(6.28),
@@ -1061,17 +3176,12 @@ class RadianExplanation101(Scene):
             run_time=2.5)
         
         self.remove(label_distance, circle_2[-1])
-        
-        circles.update()
-        circles.suspend_updating()
 
         self.play(FadeIn(timer[0][0], timer[1]))
         self.wait(0.5)
         Timer.animate(self, timer)
         self.wait()
 
-        circles.resume_updating()
-
         self.play(Write(equation), run_time=2)
         self.wait()
         self.play(
@@ -1080,9 +3190,6 @@ class RadianExplanation101(Scene):
             run_time=1.5
             )
 
-        circles.update()
-        circles.suspend_updating()
-
         self.wait(0.5)
         w1 = arcs_1.width
         w2 = arcs_2.width
@@ -1103,7 +3210,6 @@ class RadianExplanation101(Scene):
         self.wait()
         
         for j, i in enumerate([*range(1, 7), 6.28]):
-            circles.resume_updating()
             self.play(
                 angle_tracker_1.animate.set_value(i),
                 angle_tracker_2.animate.set_value(i), 
@@ -1113,8 +3219,6 @@ class RadianExplanation101(Scene):
                 labels_2[j].animate.set_color(change_color),
                 run_time=1.5
                 )
-            circles.update()
-            circles.suspend_updating()
             self.wait()
 
     def get_radian_arcs(self, radius, center, scale_factor=1.4):
@@ -1133,18 +3237,18 @@ class RadianExplanation101(Scene):
 
         labels = VGroup(
             *[
-                Text(str(i), font="Segoe UI Light", color=ANIM_ORANGE).scale(0.25).move_to(arcs[i-1].copy()
+                GlyphStore.text(str(i), font="Segoe UI Light", color=ANIM_ORANGE).scale(0.25).move_to(arcs[i-1].copy()
                     .scale(5/radius).point_from_proportion(0.5))
                 for i in range(1, 7)
             ]
         )
 
-        labels.add(Text(".28", font="Segoe UI Light", color=ANIM_ORANGE).scale(0.25).move_to(arcs[-1].copy()
+        labels.add(GlyphStore.text(".28", font="Segoe UI Light", color=ANIM_ORANGE).scale(0.25).move_to(arcs[-1].copy()
                     .scale(50/radius).point_from_proportion(0.5)))
 
         return VGroup(arcs, labels)
 
-class RadianDegreeConversion(Scene):
+class RadianDegreeConversion(PatchedScene, Scene):
     def construct(self):
         
         tmp = PolarPlane()
@@ -1225,7 +3329,7 @@ class RadianDegreeConversion(Scene):
         #                          circle2,r_ticks, r_inner_labels, r_outer_labels)))
         # self.wait(2)
 
-class RadianCalculation(Scene):
+class RadianCalculation(PatchedScene, Scene):
     def construct(self):
         
         angle_tracker = ValueTracker(PI/2)
@@ -1238,47 +3342,47 @@ class RadianCalculation(Scene):
 
         labels = [[r"90°"], [r"1/4"], [r"?", r"\,radians"]]
         
-        labels_text_1 = [MathTex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(circles[j], DOWN, buff=0.7)
+        labels_text_1 = [LazyMathTex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(circles[j], DOWN, buff=0.7)
         for j, i in enumerate(labels)]
 
-        equation = MathTex(r"{90°", r"\over 360°}", r"=", r"\frac{1}{4}", r"=", r"{?", r"\over 2\pi}", tex_template=segoe_template,
+        equation = LazyMathTex(r"{90°", r"\over 360°}", r"=", r"\frac{1}{4}", r"=", r"{?", r"\over 2\pi}", tex_template=segoe_template,
             color=TEXT_COLOR, stroke_width=0.5).scale(0.6).to_edge(UP, buff=1)
 
-        eq1_1 = MathTex(r"{90°", r"\over 360°}", r"2\pi", r"=", r"\frac{1}{4}", r"2\pi", r"=", r"\,?", tex_template=segoe_template,
+        eq1_1 = LazyMathTex(r"{90°", r"\over 360°}", r"2\pi", r"=", r"\frac{1}{4}", r"2\pi", r"=", r"\,?", tex_template=segoe_template,
             color=TEXT_COLOR, stroke_width=0.5).scale(0.6).to_edge(UP, buff=1)
 
-        eq1_2 = MathTex(r"\frac{\pi}{2}", tex_template=segoe_template,
-            color=TEXT_COLOR, stroke_width=0.5).scale(0.6).move_to(eq1_1[4])
+        eq1_2 = LazyMathTex(r"\frac{\pi}{2}", tex_template=segoe_template,
+            color=TEXT_COLOR, stroke_width=0.5).scale(0.6).move_to(lambda: eq1_1[4])
 
-        equation2 = MathTex(r"{25°", r"\over 360°}", r"=", r"\frac{25}{360}", r"=", r"{\,?", r"\over 2\pi}", tex_template=segoe_template,
+        equation2 = LazyMathTex(r"{25°", r"\over 360°}", r"=", r"\frac{25}{360}", r"=", r"{\,?", r"\over 2\pi}", tex_template=segoe_template,
             color=TEXT_COLOR, stroke_width=0.5).scale(0.6).to_edge(UP, buff=1)
 
-        eq2_0 = MathTex(r"{25°", r"\over 360°}", r"2\pi", r"=", r"\frac{25}{360}", r"2\pi", r"=", r"\,?", tex_template=segoe_template,
+        eq2_0 = LazyMathTex(r"{25°", r"\over 360°}", r"2\pi", r"=", r"\frac{25}{360}", r"2\pi", r"=", r"\,?", tex_template=segoe_template,
             color=TEXT_COLOR, stroke_width=0.5).scale(0.6).to_edge(UP, buff=1)
 
-        eq2_1 = MathTex(r"\frac{5}{72}", tex_template=segoe_template, color=TEXT_COLOR, stroke_width=0.5).scale(0.6).move_to(eq2_0[4])
+        eq2_1 = LazyMathTex(r"\frac{5}{72}", tex_template=segoe_template, color=TEXT_COLOR, stroke_width=0.5).scale(0.6).move_to(lambda: eq2_0[4])
 
-        eq2_2 = MathTex(r"\frac{10\pi}{72}", tex_template=segoe_template, color=TEXT_COLOR, stroke_width=0.5).scale(0.6).move_to(eq2_1)
+        eq2_2 = LazyMathTex(r"\frac{10\pi}{72}", tex_template=segoe_template, color=TEXT_COLOR, stroke_width=0.5).scale(0.6).move_to(eq2_1)
 
-        eq2_3 = MathTex(r"\frac{5\pi}{36}", tex_template=segoe_template, color=TEXT_COLOR, stroke_width=0.5).scale(0.6).move_to(eq2_2)
+        eq2_3 = LazyMathTex(r"\frac{5\pi}{36}", tex_template=segoe_template, color=TEXT_COLOR, stroke_width=0.5).scale(0.6).move_to(eq2_2)
 
-        equation3 = MathTex(r"{?°", r"\over 360°}", r"=", r"\frac{2}{2\pi}", r"=", r"{2\, rad", r"\over 2\pi\,rad}", tex_template=segoe_template,
+        equation3 = LazyMathTex(r"{?°", r"\over 360°}", r"=", r"\frac{2}{2\pi}", r"=", r"{2\, rad", r"\over 2\pi\,rad}", tex_template=segoe_template,
             color=TEXT_COLOR, stroke_width=0.5).scale(0.6).to_edge(UP, buff=1)
         
-        eq3_1 = MathTex(r"?°", r"=", r"\frac{1}{\pi}", r"360°", r"=", r"{2\, rad", r"\over 2\pi\,rad}", r"360°", tex_template=segoe_template,
+        eq3_1 = LazyMathTex(r"?°", r"=", r"\frac{1}{\pi}", r"360°", r"=", r"{2\, rad", r"\over 2\pi\,rad}", r"360°", tex_template=segoe_template,
             color=TEXT_COLOR, stroke_width=0.5).scale(0.6).to_edge(UP, buff=1)
 
-        eq3_2 = MathTex(r"\frac{1\, rad}{\pi\,rad}", tex_template=segoe_template,
-            color=TEXT_COLOR, stroke_width=0.5).scale(0.6).move_to(eq3_1[5:7])
+        eq3_2 = LazyMathTex(r"\frac{1\, rad}{\pi\,rad}", tex_template=segoe_template,
+            color=TEXT_COLOR, stroke_width=0.5).scale(0.6).move_to(lambda: eq3_1[5:7])
 
         labels = [[r"25°"], [r"25/360"], [r"?", r"\,radians"]]
         
-        labels_text_2 = [MathTex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(circles[j], DOWN, buff=0.7)
+        labels_text_2 = [LazyMathTex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(circles[j], DOWN, buff=0.7)
         for j, i in enumerate(labels)]
 
         labels = [[r"?°"], [r"2/2\pi"], [r"2\,radians"]]
         
-        labels_text_3 = [MathTex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(circles[j], DOWN, buff=0.7)
+        labels_text_3 = [LazyMathTex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(circles[j], DOWN, buff=0.7)
         for j, i in enumerate(labels)]
 
         self.add(get_background())
@@ -1403,23 +3507,22 @@ class RadianCalculation(Scene):
         self.play(FadeOut(equation3, *circles, *labels_text_3))
         self.wait()
 
-class Circles0to6Rad(Scene):
+class Circles0to6Rad(PatchedScene, Scene):
+    align_threshold = 350
 
     def construct(self):
 
         tracker =  ValueTracker(0)
 
-        circle1 = RadianCircle.get_circle_and_objs(8/4, 10, False, ORIGIN, tracker)
-        circle2 = RadianCircle.get_circle_and_objs(4.1/4, 5, False, (-4.5, 0, 0), tracker)
-        circle3 = RadianCircle.get_circle_and_objs(4.1/4, 5, True, (4.5, 0, 0), tracker)
+        circle1 = RadianCircle.get_circle_and_objs(8/4, 10, False, ORIGIN, tracker, rig=True)
+        circle2 = RadianCircle.get_circle_and_objs(4.1/4, 5, False, (-4.5, 0, 0), tracker, rig=True)
+        circle3 = RadianCircle.get_circle_and_objs(4.1/4, 5, True, (4.5, 0, 0), tracker, rig=True)
 
         circles = VGroup(circle1, circle2, circle3)
 
         self.add(get_background())
 
         self.add(circle1, circle2, circle3)
-        circles.update()
-        circles.suspend_updating()
 
         self.wait()
 
@@ -1431,45 +3534,31 @@ class Circles0to6Rad(Scene):
         self.wait(0.3)
         self.wait()
 
-        circles.resume_updating()
-
         self.play(tracker.animate.set_value(1), run_time=1.5)
 
-        # This is to increase render speed
-        circles.update()
-        circles.suspend_updating()
-
         self.wait()
-        rad_title = Text('1 radian', font='Segoe UI Light').scale(0.8).shift(3 * DOWN).set_color(TEXT_COLOR)
+        rad_title = GlyphStore.text('1 radian', font='Segoe UI Light').scale(0.8).shift(3 * DOWN).set_color(TEXT_COLOR)
         self.play(FadeIn(rad_title))
         self.wait(2)
         self.should_update_mobjects()
 
         for i in range(2, 7):
-            # This is to increase render speed
-            circles.resume_updating()
-
             self.play(tracker.animate.set_value(i), FadeOut(rad_title), run_time=1.5)
-            rad_title = Text(str(i) + ' radians', font='Segoe UI Light').scale(0.8).shift(3 * DOWN).set_color(TEXT_COLOR)
-            
-            # This is to increase render speed
-            circles.update()
-            circles.suspend_updating()
+            rad_title = GlyphStore.text(str(i) + ' radians', font='Segoe UI Light').scale(0.8).shift(3 * DOWN).set_color(TEXT_COLOR)
 
             self.play(FadeIn(rad_title))
             self.wait(2)
 
-        circles.resume_updating()
         self.play(tracker.animate.set_value(6.28), FadeOut(rad_title))
-        rad_title = Text('6.28 radians', font='Segoe UI Light').scale(0.8).shift(
+        rad_title = GlyphStore.text('6.28 radians', font='Segoe UI Light').scale(0.8).shift(
             3 * DOWN).set_color(
             ANIM_BLACK)
-        circles.update()
-        circles.suspend_updating()
         self.play(FadeIn(rad_title))
         self.wait(2)
 
-class EndAnimation(Scene):
+class EndAnimation(PatchedScene, Scene):
+    align_threshold = 350
+
     def construct(self):
 
         tmp = PolarPlane()
@@ -1482,11 +3571,11 @@ class EndAnimation(Scene):
 
         circles = VGroup(circle1, circle2, circle3)
 
-        rad_title = Text('6.28 radians', font='Segoe UI Light').scale(0.8).shift(
+        rad_title = GlyphStore.text('6.28 radians', font='Segoe UI Light').scale(0.8).shift(
             3 * DOWN).set_color(
             ANIM_BLACK)
 
-        rad_title_2 = Text('1 radian', font='Segoe UI Light').scale(0.8).shift(
+        rad_title_2 = GlyphStore.text('1 radian', font='Segoe UI Light').scale(0.8).shift(
         3 * DOWN).set_color(
         ANIM_BLACK)
 
@@ -1526,15 +3615,13 @@ class EndAnimation(Scene):
         a2 = ValueTracker(25*DEGREES)
         a3 = ValueTracker(2)
 
-        group_circles = VGroup()
-
-        for j, a in enumerate([a1, a2, a3]):
-            circles_ = VGroup(*[
-                RadianCircle.get_circle_and_objs(0.6, coords=(i, (1-j)*2.3, 0), tracker=a, simplified=True, segment_color=ANIM_BLACK,
-                circle_stroke_width=5)
-                for i in [-1.5, 0.5, 2.5]
-                ])
-            group_circles.add(circles_)
+        group_circles = RadianCircleField(
+            centers=[(i, (1-j)*2.3, 0) for j in range(3) for i in [-1.5, 0.5, 2.5]],
+            radii=0.6,
+            trackers=[a for a in [a1, a2, a3] for _ in range(3)],
+            segment_colors=ANIM_BLACK,
+            circle_stroke_width=5,
+            rows=3)
 
         group_circles.clear_updaters()
 
@@ -1542,26 +3629,26 @@ class EndAnimation(Scene):
 
         labels = [[r"90°"], [r"1/4"], [r"?", r"\,radians"]]
         
-        labels_text_1 = [MathTex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(group_circles[0][j], DOWN, buff=0.3)
+        labels_text_1 = [TexCache.math_tex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(group_circles[0][j], DOWN, buff=0.3)
         for j, i in enumerate(labels)]
 
-        equation = MathTex(r"{90°", r"\over 360°}", r"=", r"\frac{1}{4}", r"=", r"{?", r"\over 2\pi}", tex_template=segoe_template,
+        equation = TexCache.math_tex(r"{90°", r"\over 360°}", r"=", r"\frac{1}{4}", r"=", r"{?", r"\over 2\pi}", tex_template=segoe_template,
             color=TEXT_COLOR, stroke_width=0.5).scale(0.45).next_to(group_circles[0], buff=0.7)
 
-        equation2 = MathTex(r"{25°", r"\over 360°}", r"=", r"\frac{5}{72}", r"=", r"{?", r"\over 2\pi}", tex_template=segoe_template,
+        equation2 = TexCache.math_tex(r"{25°", r"\over 360°}", r"=", r"\frac{5}{72}", r"=", r"{?", r"\over 2\pi}", tex_template=segoe_template,
             color=TEXT_COLOR, stroke_width=0.5).scale(0.45).next_to(group_circles[1], buff=0.7)
 
-        equation3 = MathTex(r"{?°", r"\over 360°}", r"=", r"\frac{1}{\pi}", r"=", r"{2\, rad", r"\over 2\pi\,rad}", tex_template=segoe_template,
+        equation3 = TexCache.math_tex(r"{?°", r"\over 360°}", r"=", r"\frac{1}{\pi}", r"=", r"{2\, rad", r"\over 2\pi\,rad}", tex_template=segoe_template,
             color=TEXT_COLOR, stroke_width=0.5).scale(0.45).next_to(group_circles[2], buff=0.7)
 
         labels = [[r"25°"], [r"25/360"], [r"?", r"\,radians"]]
         
-        labels_text_2 = [MathTex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(group_circles[1][j], DOWN, buff=0.3)
+        labels_text_2 = [TexCache.math_tex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(group_circles[1][j], DOWN, buff=0.3)
         for j, i in enumerate(labels)]
 
         labels = [[r"?°"], [r"2/2\pi"], [r"2\,radians"]]
         
-        labels_text_3 = [MathTex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(group_circles[2][j], DOWN, buff=0.3)
+        labels_text_3 = [TexCache.math_tex(*i, tex_template=segoe_template, color=TEXT_COLOR).scale(0.5).next_to(group_circles[2][j], DOWN, buff=0.3)
         for j, i in enumerate(labels)]
 
         self.add(get_background())
@@ -1589,3 +3676,825 @@ class EndAnimation(Scene):
             self.wait()
             self.play(FadeIn(e))
             self.wait()
+
+class RadianCircleVariant(PatchedScene, Scene):
+    """The RadianCircle explainer for one set of get_circle_and_objs parameters, rendered by render_variants.
+
+    The circle appears, its angle sweeps a full turn and it fades out. The scene passes its own
+    tracker and rig, so params cannot set the reserved_params.
+    """
+    params = {}
+    reserved_params = ("tracker", "rig")
+    # Rendered by render_variants, see get_scene_classes
+    renderable = False
+    sweep_time = 6
+
+    @classmethod
+    def check_params(self, params):
+        """Raises a ValueError if params sets a parameter the scene passes itself."""
+        reserved = [name for name in self.reserved_params if name in params]
+        if reserved:
+            raise ValueError(f"RadianCircleVariant sets {', '.join(reserved)} itself, remove it from the parameters")
+
+    def construct(self):
+        self.check_params(self.params)
+        tracker = ValueTracker(0)
+        circle = RadianCircle.get_circle_and_objs(tracker=tracker, rig=True, **self.params)
+
+        self.add(get_background())
+        self.play(FadeIn(circle))
+        self.wait(0.5)
+        self.play(tracker.animate.set_value(2*PI), run_time=self.sweep_time, rate_func=linear)
+        self.wait(1)
+        self.play(FadeOut(circle))
+
+class FrameEncoder():
+    """A process piping to FFmpeg the frames put in a ring of shared memory slots.
+
+    Writing a frame copies it into the next free slot and only blocks while every slot is still
+    waiting to be encoded, so rasterizing and encoding overlap. The encoder process hands the
+    slot itself to FFmpeg, without copying it into Python bytes first. If FFmpeg exits early the
+    remaining frames of the movie are dropped and close returns its exit code, if the encoder
+    process itself dies, writing or closing raises instead of waiting forever.
+    """
+    timeout = 1
+    def __init__(self, frame_shape, slots=8):
+        """
+        Parameters
+        -----------
+        frame_shape : tuple
+            The shape of the pixel array of a frame.
+        slots : int
+            The number of frames that can wait to be encoded.
+        """
+        frame_size = int(np.prod(frame_shape))
+        self.memory = shared_memory.SharedMemory(create=True, size=frame_size * slots)
+        self.frames = np.ndarray((slots, *frame_shape), dtype=np.uint8, buffer=self.memory.buf)
+        self.next_slot = 0
+        self.free_slots = multiprocessing.Semaphore(slots)
+        self.commands = multiprocessing.SimpleQueue()
+        self.replies = multiprocessing.Queue()
+        self.process = multiprocessing.Process(
+            target=FrameEncoder.run,
+            args=(self.memory.name, frame_size, self.commands, self.replies, self.free_slots),
+            daemon=True)
+        self.process.start()
+
+    def open(self, command):
+        """Starts a new movie, encoded by the given FFmpeg command reading raw frames from stdin."""
+        self.commands.put(("open", command))
+
+    def check(self):
+        """Raises if the encoder process is no longer running."""
+        if not self.process.is_alive():
+            raise RuntimeError(f"The frame encoder process exited with code {self.process.exitcode}")
+
+    def write(self, frame):
+        """Queues a frame, blocking while the queue is full."""
+        while not self.free_slots.acquire(timeout=self.timeout):
+            self.check()
+        np.copyto(self.frames[self.next_slot], frame)
+        self.commands.put(("frame", self.next_slot))
+        self.next_slot = (self.next_slot + 1) % len(self.frames)
+
+    def close(self):
+        """Waits until every queued frame of the movie is encoded and returns the exit code of FFmpeg."""
+        self.commands.put(("close",))
+        while True:
+            try:
+                return self.replies.get(timeout=self.timeout)
+            except queue.Empty:
+                self.check()
+
+    def stop(self):
+        """Stops the encoder process and frees the shared memory."""
+        self.commands.put(("stop",))
+        self.process.join()
+        del self.frames
+        self.memory.close()
+        self.memory.unlink()
+
+    @staticmethod
+    def run(memory_name, frame_size, commands, replies, free_slots):
+        memory = shared_memory.SharedMemory(name=memory_name)
+        ffmpeg = None
+        try:
+            while True:
+                kind, *args = commands.get()
+                if kind == "frame":
+                    start = args[0] * frame_size
+                    try:
+                        ffmpeg.stdin.write(memory.buf[start:start + frame_size])
+                    except (BrokenPipeError, ValueError):
+                        # FFmpeg exited, its exit code is reported on close
+                        pass
+                    free_slots.release()
+                elif kind == "open":
+                    ffmpeg = subprocess.Popen(args[0], stdin=subprocess.PIPE)
+                elif kind == "close":
+                    try:
+                        ffmpeg.stdin.close()
+                    except BrokenPipeError:
+                        pass
+                    replies.put(ffmpeg.wait())
+                else:
+                    break
+        finally:
+            memory.close()
+
+class QueuedFileWriter(SceneFileWriter):
+    """A SceneFileWriter that encodes the movie in a FrameEncoder process instead of writing to FFmpeg itself.
+
+    It falls back to SceneFileWriter with the OpenGL renderer and in daemonic processes, which
+    cannot start the encoder.
+    """
+    queue_size = 8
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.encoder = None
+
+    def get_ffmpeg_command(self, file_path):
+        """Returns the FFmpeg command SceneFileWriter.open_movie_pipe uses with the Cairo renderer."""
+        fps = config["frame_rate"]
+        if fps == int(fps):
+            fps = int(fps)
+
+        command = [
+            FFMPEG_BIN, "-y",
+            "-f", "rawvideo", "-s", f"{config['pixel_width']}x{config['pixel_height']}", "-pix_fmt", "rgba", "-r", str(fps),
+            "-i", "-", "-an", "-loglevel", config["ffmpeg_loglevel"].lower(),
+            ]
+        if is_webm_format():
+            command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+        elif config["transparent"]:
+            command += ["-vcodec", "qtrle"]
+        else:
+            command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+
+        return command + [file_path]
+
+    def open_movie_pipe(self, file_path=None):
+        if config.renderer == "opengl" or multiprocessing.current_process().daemon:
+            return super().open_movie_pipe(file_path=file_path)
+
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+
+        if self.encoder is None:
+            self.encoder = FrameEncoder((config["pixel_height"], config["pixel_width"], 4), self.queue_size)
+        self.ffmpeg_command = self.get_ffmpeg_command(file_path)
+        self.encoder.open(self.ffmpeg_command)
+
+    def write_frame(self, frame_or_renderer):
+        if self.encoder is None or not write_to_movie():
+            return super().write_frame(frame_or_renderer)
+
+        self.encoder.write(frame_or_renderer)
+
+    def close_movie_pipe(self):
+        if self.encoder is None:
+            return super().close_movie_pipe()
+
+        returncode = self.encoder.close()
+        if returncode != 0:
+            self.encoder.stop()
+            self.encoder = None
+            raise subprocess.CalledProcessError(returncode, self.ffmpeg_command)
+        logger.info(
+            f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
+            {"path": f"'{self.partial_movie_file_path}'"},
+        )
+
+    def finish(self, *args, **kwargs):
+        if self.encoder is not None:
+            self.encoder.stop()
+            self.encoder = None
+
+        super().finish(*args, **kwargs)
+
+class DedupRenderer(CairoRenderer):
+    """A CairoRenderer that repeats the previous frame instead of rasterizing when the scene did not change.
+
+    Each frame the scene state is fingerprinted from the points, colors, stroke and order of every
+    mobject and of the camera frames. If it matches the previous frame, the last frame is sent to
+    the file writer again, so still stretches cost a hash per frame instead of a rasterization.
+    Frames are encoded in the background by a QueuedFileWriter.
+    """
+    fingerprint_arrays = ["points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "pixel_array"]
+    fingerprint_values = ["z_index", "stroke_width", "background_stroke_width", "sheen_factor"]
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("file_writer_class", QueuedFileWriter)
+        super().__init__(**kwargs)
+        self.last_fingerprint = None
+        self.repeated_frames = 0
+
+    def get_fingerprint(self, scene):
+        """Returns a digest of everything that affects the rendered frame."""
+        mobjects = [*scene.mobjects, *scene.foreground_mobjects]
+        for camera in [scene.camera, getattr(scene, "zoomed_camera", None)]:
+            if getattr(camera, "frame", None) is not None:
+                mobjects.append(camera.frame)
+
+        hasher = hashlib.blake2b(digest_size=16)
+        for mobject in mobjects:
+            for member in mobject.get_family():
+                hasher.update(id(member).to_bytes(8, "little"))
+                for name in self.fingerprint_arrays:
+                    value = getattr(member, name, None)
+                    if value is not None:
+                        hasher.update(np.ascontiguousarray(value).tobytes())
+                hasher.update(repr([getattr(member, name, None) for name in self.fingerprint_values]).encode())
+
+        return hasher.digest()
+
+    def render(self, scene, time, moving_mobjects):
+        fingerprint = self.get_fingerprint(scene)
+        if fingerprint == self.last_fingerprint:
+            self.repeated_frames += 1
+            self.add_frame(self.get_frame())
+            return
+
+        super().render(scene, time, moving_mobjects)
+        self.last_fingerprint = fingerprint
+
+    def update_frame(self, *args, **kwargs):
+        # Frames drawn outside of render (e.g. frozen waits) invalidate the fingerprint
+        self.last_fingerprint = None
+        super().update_frame(*args, **kwargs)
+
+class BenchmarkRenderer(DedupRenderer):
+    """A DedupRenderer that measures the time spent rasterizing and encoding frames."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.raster_seconds = 0
+        self.encode_seconds = 0
+        self.frames = 0
+
+    def update_frame(self, *args, **kwargs):
+        start = time.perf_counter()
+        super().update_frame(*args, **kwargs)
+        self.raster_seconds += time.perf_counter() - start
+
+    def add_frame(self, frame, num_frames=1):
+        start = time.perf_counter()
+        super().add_frame(frame, num_frames)
+        self.encode_seconds += time.perf_counter() - start
+        self.frames += num_frames
+
+    def scene_finished(self, scene):
+        start = time.perf_counter()
+        super().scene_finished(scene)
+        self.encode_seconds += time.perf_counter() - start
+
+class DraftFileWriter(QueuedFileWriter):
+    """A QueuedFileWriter encoding the frames kept by its DraftRenderer at their own frame rate."""
+    def open_movie_pipe(self, file_path=None):
+        with tempconfig({"frame_rate": config["frame_rate"] / self.renderer.stride}):
+            super().open_movie_pipe(file_path=file_path)
+
+class DraftRenderer(DedupRenderer):
+    """A DedupRenderer that steps the scene at the final frame rate but only keeps every stride-th frame.
+
+    Updaters and animations run on exactly the frames of the final render, so the draft ends every
+    play in the same state and at the same time. Frames that are not kept are not rasterized.
+    """
+    def __init__(self, stride=1, **kwargs):
+        kwargs.setdefault("file_writer_class", DraftFileWriter)
+        super().__init__(**kwargs)
+        self.stride = stride
+        self.frame_index = 0
+
+    def render(self, scene, time, moving_mobjects):
+        if self.frame_index % self.stride:
+            self.add_frame(None)
+            return
+        super().render(scene, time, moving_mobjects)
+
+    def add_frame(self, frame, num_frames=1):
+        # Keeps the frames whose index in the final render is a multiple of stride
+        kept = len(range(-self.frame_index % self.stride, num_frames, self.stride))
+        self.frame_index += num_frames
+        self.time += (num_frames - kept) / self.camera.frame_rate
+        super().add_frame(frame, kept)
+
+class SegmentFileWriter(QueuedFileWriter):
+    """A QueuedFileWriter that writes nothing while its SegmentRenderer replays earlier plays."""
+    def begin_animation(self, allow_write=False):
+        super().begin_animation(allow_write and not self.renderer.replaying)
+
+    def end_animation(self, allow_write=False):
+        super().end_animation(allow_write and not self.renderer.replaying)
+
+    def add_partial_movie_file(self, hash_animation):
+        super().add_partial_movie_file(None if self.renderer.replaying else hash_animation)
+
+class SegmentRenderer(DedupRenderer):
+    """A DedupRenderer that only rasterizes and writes the plays in [start, end).
+
+    Earlier plays are replayed frame by frame with every updater, but without rasterizing or
+    encoding, so the scene state at start is exactly the one of a serial render. The scene
+    ends right after the last play of the segment.
+    """
+    def __init__(self, start=0, end=None, **kwargs):
+        super().__init__(**kwargs)
+        self.start = start
+        self.end = end
+        self.durations = []
+
+    @property
+    def replaying(self):
+        return self.num_plays < self.start
+
+    def init_scene(self, scene):
+        super().init_scene(scene)
+        self.file_writer = SegmentFileWriter(self, scene.__class__.__name__)
+
+    def play(self, scene, *args, **kwargs):
+        if self.end is not None and self.num_plays >= self.end:
+            raise EndSceneEarlyException()
+        super().play(scene, *args, **kwargs)
+        self.durations.append(scene.duration)
+
+    def render(self, *args, **kwargs):
+        if not self.replaying:
+            super().render(*args, **kwargs)
+
+    def update_frame(self, *args, **kwargs):
+        if not self.replaying:
+            super().update_frame(*args, **kwargs)
+
+    def add_frame(self, *args, **kwargs):
+        if not self.replaying:
+            super().add_frame(*args, **kwargs)
+
+def record_plan(scene_name):
+    """Runs the construct method of a scene without rendering and returns the duration of each play and wait."""
+    with tempconfig({"dry_run": True}):
+        renderer = SegmentRenderer(skip_animations=True)
+        globals()[scene_name](renderer=renderer).render()
+
+    return renderer.durations
+
+def split_plan(durations, parts):
+    """Splits the plays into at most parts contiguous segments of similar duration.
+
+    Returns
+    -----------
+    list
+        A list of (start, end) play indices.
+    """
+    total = sum(durations)
+    segments = []
+    start = 0
+    elapsed = 0
+    for i, duration in enumerate(durations):
+        elapsed += duration
+        if elapsed >= total * (len(segments) + 1) / parts and i + 1 < len(durations):
+            segments.append((start, i + 1))
+            start = i + 1
+    segments.append((start, len(durations)))
+
+    return segments
+
+def render_segment(scene_name, start, end, quality, output_file):
+    """Renders the plays in [start, end) of a scene to its own movie file and returns its path."""
+    with tempconfig({"quality": quality, "disable_caching": True, "output_file": output_file}):
+        scene = globals()[scene_name](renderer=SegmentRenderer(start, end))
+        scene.render()
+        path = str(scene.renderer.file_writer.movie_file_path)
+
+    GlyphStore.save()
+
+    return path
+
+def render_scene_parallel(scene_name, quality="high_quality", workers=None):
+    """Renders a single scene with its plays split across worker processes.
+
+    A cheap recording pass gives the duration of every play and wait, the plays are split in
+    contiguous segments rendered in parallel, and the segment movies are concatenated without
+    encoding again, like manim concatenates its partial movie files.
+
+    Parameters
+    -----------
+    scene_name : str
+        The name of the Scene subclass to render.
+    quality : str
+        One of the manim quality names, for example "low_quality".
+    workers : int
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -----------
+    str
+        The path of the movie file.
+    """
+    workers = workers or os.cpu_count() or 1
+    segments = split_plan(record_plan(scene_name), workers)
+
+    with ProcessPoolExecutor(max_workers=len(segments)) as executor:
+        paths = list(executor.map(
+            render_segment,
+            [scene_name] * len(segments),
+            [start for start, _ in segments],
+            [end for _, end in segments],
+            [quality] * len(segments),
+            [f"{scene_name}_segment{i:03}" for i in range(len(segments))]))
+
+    output = os.path.join(os.path.dirname(paths[0]), scene_name + os.path.splitext(paths[0])[1])
+
+    return concat_movies(paths, output)
+
+def concat_movies(paths, output):
+    """Concatenates movie files without encoding again, like manim concatenates its partial movie files, and returns output."""
+    list_path = os.path.splitext(output)[0] + "_segments.txt"
+    with open(list_path, "w", encoding="utf-8") as f:
+        f.writelines(f"file '{os.path.abspath(path)}'\n" for path in paths)
+
+    subprocess.run(
+        [FFMPEG_BIN, "-y", "-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", "-loglevel", "error", output],
+        check=True)
+
+    return output
+
+def render_timeline(scene_name, quality="high_quality", workers=None):
+    """Renders a TimelineScene, reusing the movie of every segment whose hash did not change.
+
+    Missing segments are rendered in parallel like in render_scene_parallel, and the movie file
+    of every segment is remembered by hash in timeline_cache/index.json in the media directory.
+
+    Parameters
+    -----------
+    scene_name : str
+        The name of the TimelineScene subclass to render.
+    quality : str
+        One of the manim quality names, for example "low_quality".
+    workers : int
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -----------
+    str
+        The path of the movie file.
+    """
+    segments = globals()[scene_name].get_segments(quality)
+
+    index_path = os.path.join(config.media_dir, "timeline_cache", "index.json")
+    index = {}
+    if os.path.isfile(index_path):
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+
+    missing = [segment for segment in segments if not os.path.isfile(index.get(segment[3], ""))]
+    if missing:
+        with ProcessPoolExecutor(max_workers=min(len(missing), workers or os.cpu_count() or 1)) as executor:
+            paths = executor.map(
+                render_segment,
+                [scene_name] * len(missing),
+                [start for _, start, _, _ in missing],
+                [end for _, _, end, _ in missing],
+                [quality] * len(missing),
+                [f"{scene_name}_{name}_{segment_hash[:12]}" for name, _, _, segment_hash in missing])
+            for (_, _, _, segment_hash), path in zip(missing, paths):
+                index[segment_hash] = path
+
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=4)
+
+    paths = [index[segment_hash] for _, _, _, segment_hash in segments]
+    output = os.path.join(os.path.dirname(paths[0]), scene_name + os.path.splitext(paths[0])[1])
+
+    return concat_movies(paths, output)
+
+def render_scene(scene_name, quality="high_quality"):
+    """Renders one scene of this module and returns its timings and output path.
+
+    Parameters
+    -----------
+    scene_name : str
+        The name of the Scene subclass to render.
+    quality : str
+        One of the manim quality names, for example "low_quality".
+
+    Returns
+    -----------
+    dict
+        The scene name, the render time in seconds and the path of the movie file, or the error.
+    """
+    result = {"scene": scene_name, "quality": quality}
+    start = time.perf_counter()
+
+    try:
+        # tempconfig keeps changes made by a scene from leaking into the next one
+        with tempconfig({"quality": quality}):
+            scene = globals()[scene_name](renderer=DedupRenderer())
+            scene.render()
+            result["output"] = str(scene.renderer.file_writer.movie_file_path)
+            result["repeated_frames"] = scene.renderer.repeated_frames
+    except Exception as e:
+        result["error"] = repr(e)
+
+    result["seconds"] = time.perf_counter() - start
+
+    # Pool workers exit without running atexit handlers
+    GlyphStore.save()
+
+    return result
+
+def render_draft(scene_name, quality="high_quality", resolution=None, frame_rate=None):
+    """Renders a quick preview of a scene with the timing of the final render.
+
+    The draft keeps every n-th frame of the final render, n being the largest whole number for
+    which the draft frame rate is at least frame_rate, so plays and waits keep their final
+    number of frames and the draft never drifts by more than one of its own frames.
+
+    Parameters
+    -----------
+    scene_name : str
+        The name of the Scene subclass to render.
+    quality : str
+        The manim quality whose resolution is scaled down.
+    resolution : float
+        The fraction of the resolution of quality to render at. Defaults to Draft.resolution.
+    frame_rate : float
+        The lowest frame rate of the draft. Defaults to Draft.frame_rate.
+
+    Returns
+    -----------
+    str
+        The path of the movie file.
+    """
+    resolution = resolution or Draft.resolution
+    # libx264 needs even dimensions
+    pixel_width, pixel_height = [
+        max(2, int(QUALITIES[quality][name] * resolution) // 2 * 2) for name in ["pixel_width", "pixel_height"]]
+
+    final_frame_rate = QUALITIES[quality]["frame_rate"]
+    stride = max(1, int(final_frame_rate // (frame_rate or Draft.frame_rate)))
+
+    Draft.enabled = True
+    try:
+        with tempconfig({
+                "pixel_width": pixel_width,
+                "pixel_height": pixel_height,
+                "frame_rate": final_frame_rate,
+                "output_file": scene_name + "_draft",
+                }):
+            scene = globals()[scene_name](renderer=DraftRenderer(stride))
+            scene.render()
+            return str(scene.renderer.file_writer.movie_file_path)
+    finally:
+        Draft.enabled = False
+
+def render_variant(params, quality, output_file):
+    """Renders a RadianCircleVariant with the given parameters and returns the path of its movie file."""
+    with tempconfig({"quality": quality, "output_file": output_file}):
+        scene = RadianCircleVariant(renderer=DedupRenderer())
+        scene.params = params
+        scene.render()
+        path = str(scene.renderer.file_writer.movie_file_path)
+
+    GlyphStore.save()
+
+    return path
+
+def render_variants(param_grid, quality="high_quality", workers=None, manifest_path=None):
+    """Renders a RadianCircleVariant for every combination of get_circle_and_objs parameters.
+
+    Labels only depend on label_radius, use_letters and show_angle_label, so every frame of
+    each distinct label configuration is replayed once without rasterizing to fill the TeX and
+    glyph caches. The variants are then rendered in parallel by workers reading those caches
+    from disk, whatever the start method of the pool. The labels kept in memory by LabelCache
+    only reach workers that are forked; others build each label once from the disk caches.
+
+    Parameters
+    -----------
+    param_grid : dict
+        The values of each parameter, e.g. {"radius": [1, 2], "segment_color": [ANIM_ORANGE, ANIM_AQUA]}.
+        tracker and rig are set by RadianCircleVariant and raise a ValueError.
+    quality : str
+        One of the manim quality names, for example "low_quality".
+    workers : int
+        The number of worker processes. Defaults to the number of CPUs.
+    manifest_path : str
+        Where to write the JSON manifest. Defaults to variants_manifest.json in the media directory.
+
+    Returns
+    -----------
+    list
+        The parameters and movie file of every variant.
+    """
+    RadianCircleVariant.check_params(param_grid)
+    names = list(param_grid)
+    variants = [dict(zip(names, values)) for values in itertools.product(*param_grid.values())]
+    if manifest_path is None:
+        manifest_path = os.path.join(config.media_dir, "variants_manifest.json")
+
+    label_params = {}
+    for params in variants:
+        key = tuple(params.get(name) for name in ["label_radius", "use_letters", "show_angle_label"])
+        label_params.setdefault(key, params)
+
+    with tempconfig({"quality": quality, "dry_run": True}):
+        for params in label_params.values():
+            # Replaying every play runs the updaters on every frame without rasterizing
+            scene = RadianCircleVariant(renderer=SegmentRenderer(start=float("inf")))
+            scene.params = params
+            scene.render()
+    GlyphStore.save()
+
+    output_files = [
+        f"RadianCircleVariant_{i:03}_{hashlib.blake2b(get_stable_identity(params).encode(), digest_size=4).hexdigest()}"
+        for i, params in enumerate(variants)]
+    with ProcessPoolExecutor(max_workers=min(len(variants), workers or os.cpu_count() or 1)) as executor:
+        paths = list(executor.map(render_variant, variants, [quality] * len(variants), output_files))
+
+    manifest = [{"params": get_stable_identity(params), "output": path} for params, path in zip(variants, paths)]
+    os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+
+    return manifest
+
+def render_all(scene_names=None, quality="high_quality", workers=None, manifest_path=None):
+    """Renders scenes of this module in parallel on a process pool and writes a manifest.
+
+    The workers share the TeX and glyph caches through the filesystem. TeX batches compile in a
+    temporary directory of their own and cache entries are moved into place atomically, so no
+    worker reads a partial file. manim's own MathTex and Text fallbacks write to the shared
+    tex and text directories, and GlyphStore.save merges the glyphs of every worker under a lock.
+
+    Parameters
+    -----------
+    scene_names : list
+        The names of the scenes to render. Defaults to every scene in this module.
+    quality : str
+        One of the manim quality names, for example "low_quality".
+    workers : int
+        The number of worker processes. Defaults to the number of CPUs.
+    manifest_path : str
+        Where to write the JSON manifest. Defaults to render_manifest.json in the media directory.
+
+    Returns
+    -----------
+    dict
+        The manifest.
+    """
+    if scene_names is None:
+        scene_names = [scene_class.__name__ for scene_class in get_scene_classes()]
+    if workers is None:
+        workers = min(len(scene_names), os.cpu_count() or 1)
+    if manifest_path is None:
+        manifest_path = os.path.join(config.media_dir, "render_manifest.json")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        scenes = list(executor.map(render_scene, scene_names, [quality] * len(scene_names)))
+
+    manifest = {
+        "quality": quality,
+        "workers": workers,
+        "seconds": time.perf_counter() - start,
+        "scenes": scenes,
+        }
+
+    os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+
+    return manifest
+
+def benchmark_scene(scene_name, quality="low_quality", cold=False):
+    """Renders one scene of this module and measures where the time goes.
+
+    A cold run uses empty TeX, glyph, text and background caches in a temporary directory, a
+    warm run the regular caches as they are (benchmark_all fills them in a separate process
+    first). Movie caching is disabled for both.
+
+    Parameters
+    -----------
+    scene_name : str
+        The name of the Scene subclass to render.
+    quality : str
+        One of the manim quality names, for example "low_quality".
+    cold : bool
+        Whether to render with empty caches.
+
+    Returns
+    -----------
+    dict
+        The rasterization and encoding times in seconds, the remaining time (building mobjects,
+        running updaters and interpolating animations), the frames per second and the peak
+        memory in MB of the process, or the error.
+    """
+    result = {"scene": scene_name, "quality": quality, "caches": "cold" if cold else "warm"}
+    options = {"quality": quality, "disable_caching": True, "output_file": scene_name + "_benchmark"}
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if cold:
+            TexCache.directory = os.path.join(cache_dir, "tex_cache")
+            GlyphStore.directory = os.path.join(cache_dir, "glyph_store")
+            BackgroundRaster.directory = os.path.join(cache_dir, "background_cache")
+            options["tex_dir"] = os.path.join(cache_dir, "Tex")
+            options["text_dir"] = os.path.join(cache_dir, "texts")
+
+        try:
+            with tempconfig(options):
+                renderer = BenchmarkRenderer()
+                start = time.perf_counter()
+                globals()[scene_name](renderer=renderer).render()
+                seconds = time.perf_counter() - start
+        except Exception as e:
+            result["error"] = repr(e)
+            return result
+
+    result.update({
+        "other_seconds": seconds - renderer.raster_seconds - renderer.encode_seconds,
+        "raster_seconds": renderer.raster_seconds,
+        "encode_seconds": renderer.encode_seconds,
+        "seconds": seconds,
+        "frames": renderer.frames,
+        "repeated_frames": renderer.repeated_frames,
+        "fps": renderer.frames / seconds,
+        # ru_maxrss is in KB on Linux
+        "peak_memory_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 if resource else None,
+        })
+
+    return result
+
+def benchmark_all(scene_names=None, quality="low_quality", output_path=None):
+    """Benchmarks scenes of this module with cold and warm caches and writes the results as JSON.
+
+    Every run happens in a fresh process, one after the other, so runs neither share memory nor
+    compete for the CPU. The caches of a warm run are filled in another process beforehand.
+
+    Parameters
+    -----------
+    scene_names : list
+        The names of the scenes to benchmark. Defaults to every scene in this module.
+    quality : str
+        One of the manim quality names, for example "low_quality".
+    output_path : str
+        Where to write the results. Defaults to benchmark.json in the media directory.
+
+    Returns
+    -----------
+    list
+        The result of every run.
+    """
+    if scene_names is None:
+        scene_names = [scene_class.__name__ for scene_class in get_scene_classes()]
+    if output_path is None:
+        output_path = os.path.join(config.media_dir, "benchmark.json")
+
+    results = []
+    for scene_name in scene_names:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results.append(executor.submit(benchmark_scene, scene_name, quality, True).result())
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            executor.submit(TexCache.warm, [globals()[scene_name]]).result()
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results.append(executor.submit(benchmark_scene, scene_name, quality, False).result())
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4)
+
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Renders the scenes of this module in parallel.")
+    parser.add_argument("scenes", nargs="*", help="The scenes to render, every scene if omitted.")
+    parser.add_argument("-q", "--quality", default=None, choices=list(QUALITIES),
+                        help="Defaults to high_quality, or low_quality when benchmarking.")
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--manifest", default=None, help="Where to write the render manifest or the benchmark results.")
+    parser.add_argument("--split", action="store_true", help="Render one scene at a time, split across the workers.")
+    parser.add_argument("--benchmark", action="store_true", help="Benchmark the scenes with cold and warm caches instead.")
+    parser.add_argument("--profile-updaters", action="store_true", help="Report the time spent in every updater at the end of each scene.")
+    parser.add_argument("--draft", action="store_true", help="Render quick previews with the final timing, see Draft.")
+    args = parser.parse_args()
+
+    if args.profile_updaters:
+        # Also seen by worker processes that import this module again
+        os.environ["PROFILE_UPDATERS"] = "1"
+        UpdaterProfiler.install()
+
+    if args.benchmark:
+        benchmark_all(args.scenes or None, args.quality or "low_quality", args.manifest)
+    elif args.draft:
+        for scene_name in args.scenes or [scene_class.__name__ for scene_class in get_scene_classes()]:
+            render_draft(scene_name, args.quality or "high_quality")
+    elif args.split:
+        for scene_name in args.scenes or [scene_class.__name__ for scene_class in get_scene_classes()]:
+            if issubclass(globals()[scene_name], TimelineScene):
+                render_timeline(scene_name, args.quality or "high_quality", args.workers)
+            else:
+                render_scene_parallel(scene_name, args.quality or "high_quality", args.workers)
+    else:
+        render_all(args.scenes or None, args.quality or "high_quality", args.workers, args.manifest)